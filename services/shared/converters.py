@@ -7,6 +7,7 @@ Handles datetime → ISO string and Decimal → string conversions with precisio
 
 from __future__ import annotations
 
+import sys
 from datetime import datetime
 from decimal import Decimal
 
@@ -102,14 +103,15 @@ def dto_to_transaction_event(dto: TransactionEventDTO) -> TransactionEvent:
     # Parse Decimal from string (preserves precision)
     price = Decimal(dto.price)
 
+    # Positional args in field order: called once per event in a batch
     return TransactionEvent(
-        timestamp=timestamp,
-        account_id=dto.account_id,
-        product_id=dto.product_id,
-        side=dto.side,
-        price=price,
-        quantity=dto.quantity,
-        event_type=dto.event_type,
+        timestamp,
+        dto.account_id,
+        dto.product_id,
+        sys.intern(dto.side),
+        price,
+        dto.quantity,
+        sys.intern(dto.event_type),
     )
 
 
@@ -8,12 +8,79 @@ without changing net position.
 
 from __future__ import annotations
 
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timedelta
 from decimal import Decimal
-from typing import Iterable, List
+from itertools import accumulate, repeat
+from operator import attrgetter, mul, ne
+from typing import Dict, Iterable, List, Sequence, Tuple
 
 from ..models import Side, SuspiciousSequence, TransactionEvent, WashTradingConfig
-from ..utils.detection_utils import group_events_by_account_product
+from ..utils.detection_utils import (
+    AccountProductKey,
+    group_events_by_account_product,
+    validate_positive,
+)
+
+# (start_idx, end_idx, total_buy_qty, total_sell_qty, alternation_percentage)
+# for a window trades[start_idx:end_idx] that meets all thresholds
+WindowMatch = Tuple[int, int, int, int, float]
+
+# (epoch microsecond timestamps, is_buy, quantities) columns of one group
+GroupColumns = Tuple[List[int], List[bool], List[int]]
+
+_ONE_MICROSECOND = timedelta(microseconds=1)
+
+
+@dataclass
+class _GroupScanState:
+    """
+    Result of scanning one (account_id, product_id) group, kept for resumption.
+    
+    Attributes:
+        trade_count: Number of trades in the group when it was scanned.
+        last_trade: Last trade of the group (used to verify append-only input).
+        open_start_idx: First window start whose window reached the last trade.
+            Windows starting before it are closed: any appended trade falls
+            outside them, so their results cannot change.
+        closed_sequences: Sequences detected for windows starting before
+            open_start_idx.
+        sequences: All sequences detected for the group, returned as-is when
+            the group is unchanged on the next run.
+    """
+
+    trade_count: int
+    last_trade: TransactionEvent
+    open_start_idx: int
+    closed_sequences: List[SuspiciousSequence]
+    sequences: List[SuspiciousSequence]
+
+
+@dataclass
+class WashTradingScanState:
+    """
+    Memo of previous `detect_wash_trading()` runs for append-only event streams.
+    
+    Pass the same instance to successive `detect_wash_trading()` calls whose
+    inputs extend the previous input (all earlier events plus new events at or
+    after the last seen timestamp). Each group then only re-scans the windows
+    that could still grow; closed windows are returned from the memo, and
+    groups that did not change since the previous call are not scanned at all.
+    
+    The append-only contract is verified cheaply per group (trade count and
+    last trade); groups that fail the check are re-scanned in full. The state
+    resets itself when called with a different config.
+    
+    Example:
+        >>> state = WashTradingScanState()
+        >>> sequences = detect_wash_trading(first_batch, state=state)
+        >>> sequences = detect_wash_trading(first_batch + second_batch, state=state)
+    """
+
+    config: WashTradingConfig | None = None
+    groups: Dict[AccountProductKey, _GroupScanState] = field(default_factory=dict)
 
 
 def _calculate_alternation_percentage(trades: List[TransactionEvent]) -> float:
@@ -44,14 +111,14 @@ def _calculate_alternation_percentage(trades: List[TransactionEvent]) -> float:
     return (side_switches / total_transitions) * 100.0
 
 
-def _calculate_price_change_percentage(trades: List[TransactionEvent]) -> float | None:
+def _calculate_price_change_percentage(trades: Sequence[TransactionEvent]) -> float | None:
     """
     Calculate price change percentage during the window.
     
     Price change % = |(last_price - first_price) / first_price| * 100
     
     Args:
-        trades: List of trades sorted by timestamp (non-empty).
+        trades: Trades sorted by timestamp. Only the first and last are used.
     
     Returns:
         Price change percentage, or None if no trades.
@@ -69,6 +136,29 @@ def _calculate_price_change_percentage(trades: List[TransactionEvent]) -> float
     return price_change
 
 
+def _reportable_price_change(
+    first_trade: TransactionEvent,
+    last_trade: TransactionEvent,
+    threshold: float,
+) -> float | None:
+    """
+    Price change percentage of a window, or None if below the reporting threshold.
+    
+    Args:
+        first_trade: First trade of the window.
+        last_trade: Last trade of the window.
+        threshold: Minimum price change percentage worth reporting.
+    
+    Returns:
+        Price change percentage if it is >= threshold, otherwise None.
+    """
+    # Price change only depends on the window's first and last trade
+    price_change_pct = _calculate_price_change_percentage((first_trade, last_trade))
+    if price_change_pct is None or price_change_pct < threshold:
+        return None
+    return price_change_pct
+
+
 def _collect_window_trades(
     trades: List[TransactionEvent],
     start_idx: int,
@@ -186,6 +276,267 @@ def _validate_wash_trading_window(
     return True, buy_trades, sell_trades
 
 
+def _scan_windows(
+    timestamps: Sequence[int],
+    is_buy: Sequence[bool],
+    quantities: Sequence[int],
+    window_size: int,
+    min_buy_trades: int,
+    min_sell_trades: int,
+    min_total_volume: int,
+    min_alternation_percentage: float,
+    skip_overlapping: bool = False,
+) -> List[WindowMatch]:
+    """
+    Scan all sliding windows of a group and return those meeting every threshold.
+    
+    Operates on plain per-trade columns (no TransactionEvent access) so the inner
+    loop only touches list items and local variables. Timestamps are integers,
+    so window boundary checks are int comparisons rather than datetime
+    arithmetic that allocates a timedelta per comparison.
+    
+    OPTIMIZATION: Prefix sums of BUY count, BUY volume, total volume and side
+    switches are built once per group (in C via itertools.accumulate). Any window
+    [start_idx, end_idx) then yields its metrics as prefix differences in O(1),
+    and the end pointer only moves forward, so the whole scan is O(n). Start
+    indices stop where fewer than min_buy_trades + min_sell_trades trades remain.
+    
+    Args:
+        timestamps: Trade timestamps as epoch microseconds, sorted ascending.
+        is_buy: True for BUY trades, False for SELL trades.
+        quantities: Trade quantities.
+        window_size: Size of the time window in microseconds (inclusive of the boundary).
+        min_buy_trades: Minimum number of BUY trades required.
+        min_sell_trades: Minimum number of SELL trades required.
+        min_total_volume: Minimum total volume required.
+        min_alternation_percentage: Minimum alternation percentage required.
+        skip_overlapping: If True, after a valid window [start_idx, end_idx) the
+            scan resumes at end_idx, so reported windows never overlap.
+    
+    Returns:
+        List of (start_idx, end_idx, total_buy_qty, total_sell_qty, alternation_pct)
+        tuples, one per valid window. end_idx is exclusive.
+    """
+    matches: List[WindowMatch] = []
+    n = len(timestamps)
+    min_window_count = min_buy_trades + min_sell_trades
+    
+    # prefix[i] = aggregate over trades[0:i]
+    buy_count_prefix = list(accumulate(is_buy, initial=0))
+    volume_prefix = list(accumulate(quantities, initial=0))
+    
+    # Every window is a subset of the group: if the whole group misses a
+    # count or volume threshold, so does every window. This also rejects
+    # groups with fewer than min_buy_trades + min_sell_trades trades
+    group_buys = buy_count_prefix[-1]
+    if (
+        group_buys < min_buy_trades
+        or n - group_buys < min_sell_trades
+        or volume_prefix[-1] < min_total_volume
+    ):
+        return matches
+    
+    # Element-wise products/comparisons via map() over operator functions run
+    # in C, unlike equivalent generator expressions
+    buy_volume_prefix = list(accumulate(map(mul, quantities, is_buy), initial=0))
+    # switch_prefix[i] = side switches between consecutive trades up to trades[i]
+    switch_prefix = list(accumulate(map(ne, is_buy, is_buy[1:]), initial=0))
+    
+    end_idx = 0
+    next_start_idx = 0
+    for start_idx in range(n - min_window_count + 1):
+        if start_idx < next_start_idx:
+            # Inside the last reported window (skip_overlapping only)
+            continue
+        
+        window_end = timestamps[start_idx] + window_size
+        
+        # Advance the right edge (monotonic: never moves backwards)
+        while end_idx < n and timestamps[end_idx] <= window_end:
+            end_idx += 1
+        
+        # Cheap O(1) checks first: counts, then volume, then alternation
+        window_count = end_idx - start_idx
+        buy_count = buy_count_prefix[end_idx] - buy_count_prefix[start_idx]
+        if buy_count < min_buy_trades or window_count - buy_count < min_sell_trades:
+            continue
+        
+        total_volume = volume_prefix[end_idx] - volume_prefix[start_idx]
+        if total_volume < min_total_volume:
+            continue
+        
+        side_switches = switch_prefix[end_idx - 1] - switch_prefix[start_idx]
+        alternation_pct = (side_switches / (window_count - 1)) * 100.0
+        if alternation_pct < min_alternation_percentage:
+            continue
+        
+        buy_qty = buy_volume_prefix[end_idx] - buy_volume_prefix[start_idx]
+        matches.append((start_idx, end_idx, buy_qty, total_volume - buy_qty, alternation_pct))
+        if skip_overlapping:
+            next_start_idx = end_idx
+    
+    return matches
+
+
+def _group_columns(trades: Sequence[TransactionEvent]) -> GroupColumns:
+    """
+    Extract the per-field columns scanned by `_scan_windows()` from a group.
+    
+    Args:
+        trades: TRADE_EXECUTED events of one group, sorted by timestamp.
+    
+    Returns:
+        Tuple of (epoch microsecond timestamps, BUY flags, quantities).
+    """
+    return (
+        [t.timestamp_us for t in trades],
+        [t.side == "BUY" for t in trades],
+        [t.quantity for t in trades],
+    )
+
+
+def _scan_group_columns(columns: GroupColumns, config: WashTradingConfig) -> List[WindowMatch]:
+    """
+    Scan the columns of one group with the thresholds of a config.
+    
+    Module-level (picklable) so it can run in worker processes: its inputs and
+    outputs are plain ints, bools and tuples, which pickle far cheaper than
+    TransactionEvent objects with datetime and Decimal fields.
+    
+    Args:
+        columns: Group columns as returned by `_group_columns()`.
+        config: Wash trading detection configuration.
+    
+    Returns:
+        Matching windows as returned by `_scan_windows()`.
+    """
+    timestamps, is_buy, quantities = columns
+    return _scan_windows(
+        timestamps,
+        is_buy,
+        quantities,
+        config.window_size // _ONE_MICROSECOND,
+        config.min_buy_trades,
+        config.min_sell_trades,
+        config.min_total_volume,
+        config.min_alternation_percentage,
+        config.overlap_policy == "skip",
+    )
+
+
+def _build_sequences(
+    account_id: str,
+    product_id: str,
+    trades: Sequence[TransactionEvent],
+    matches: Iterable[WindowMatch],
+    config: WashTradingConfig,
+) -> List[SuspiciousSequence]:
+    """
+    Build SuspiciousSequence objects for the matching windows of a group.
+    
+    Args:
+        account_id: Account identifier.
+        product_id: Product identifier.
+        trades: TRADE_EXECUTED events of the group, sorted by timestamp.
+        matches: Matching windows over `trades` from `_scan_windows()`.
+        config: Wash trading detection configuration.
+    
+    Returns:
+        One suspicious wash trading sequence per match, in match order.
+    """
+    price_change_threshold = config.optional_price_change_threshold
+    
+    return [
+        SuspiciousSequence(
+            account_id=account_id,
+            product_id=product_id,
+            start_timestamp=trades[start_idx].timestamp,
+            end_timestamp=trades[end_idx - 1].timestamp,  # Last trade in window
+            total_buy_qty=total_buy_qty,
+            total_sell_qty=total_sell_qty,
+            detection_type="WASH_TRADING",
+            side=None,  # Not applicable for wash trading
+            num_cancelled_orders=None,  # Not applicable for wash trading
+            order_timestamps=None,  # Not applicable for wash trading
+            alternation_percentage=alternation_pct,
+            price_change_percentage=_reportable_price_change(
+                trades[start_idx], trades[end_idx - 1], price_change_threshold
+            ),
+        )
+        for start_idx, end_idx, total_buy_qty, total_sell_qty, alternation_pct in matches
+    ]
+
+
+def _dedupe_overlapping_sequences(
+    sequences: Sequence[SuspiciousSequence],
+) -> List[SuspiciousSequence]:
+    """
+    Collapse each run of overlapping windows of a group into its first window.
+    
+    A window overlaps the previous one if it starts at or before the last trade
+    seen so far; all windows in such a chain are represented by the earliest one.
+    Comparing timestamps is equivalent to comparing trade indices: a window
+    includes every trade at its end timestamp, so a window starting at that
+    timestamp necessarily shares a trade with it.
+    
+    Args:
+        sequences: Sequences of one group, ordered by start timestamp.
+    
+    Returns:
+        The first sequence of every run of overlapping sequences.
+    """
+    deduped: List[SuspiciousSequence] = []
+    last_end: datetime | None = None
+    for seq in sequences:
+        if last_end is not None and seq.start_timestamp <= last_end:
+            last_end = max(last_end, seq.end_timestamp)
+            continue
+        deduped.append(seq)
+        last_end = seq.end_timestamp
+    return deduped
+
+
+def _skip_overlapping_sequences(
+    sequences: Sequence[SuspiciousSequence],
+) -> List[SuspiciousSequence]:
+    """
+    Keep each sequence that starts after the last kept one ends.
+    
+    Sequence-level equivalent of scanning with `skip_overlapping`, used where
+    results are assembled from separately scanned parts (incremental scans).
+    
+    Args:
+        sequences: Sequences of one group, ordered by start timestamp.
+    
+    Returns:
+        Non-overlapping sequences, greedily chosen from the earliest.
+    """
+    kept: List[SuspiciousSequence] = []
+    last_end: datetime | None = None
+    for seq in sequences:
+        if last_end is None or seq.start_timestamp > last_end:
+            kept.append(seq)
+            last_end = seq.end_timestamp
+    return kept
+
+
+def _can_hold_window(trades: Sequence[TransactionEvent], config: WashTradingConfig) -> bool:
+    """
+    Check whether a group has enough trades to hold any valid window.
+    
+    Groups with fewer than min_buy_trades + min_sell_trades trades are skipped
+    before their columns are built, and are never shipped to worker processes.
+    
+    Args:
+        trades: TRADE_EXECUTED events of one group.
+        config: Wash trading detection configuration.
+    
+    Returns:
+        True if the group has at least min_buy_trades + min_sell_trades trades.
+    """
+    return len(trades) >= config.min_buy_trades + config.min_sell_trades
+
+
 def _detect_wash_trading_for_group(
     account_id: str,
     product_id: str,
@@ -198,6 +549,10 @@ def _detect_wash_trading_for_group(
     Uses a sliding window approach: for each trade, create a window
     starting at that trade's timestamp and check if the window meets all criteria.
     
+    The trades are converted to per-field columns once and scanned by
+    `_scan_windows()`; TransactionEvent objects are only touched again to build
+    the SuspiciousSequence for windows that pass every threshold.
+    
     Args:
         account_id: Account identifier.
         product_id: Product identifier.
@@ -207,60 +562,81 @@ def _detect_wash_trading_for_group(
     Returns:
         List of detected suspicious wash trading sequences.
     """
-    sequences: List[SuspiciousSequence] = []
+    if not _can_hold_window(trades, config):
+        return []
     
-    if len(trades) < config.min_buy_trades + config.min_sell_trades:
-        # Not enough trades to meet minimum requirements
-        return sequences
+    matches = _scan_group_columns(_group_columns(trades), config)
+    return _build_sequences(account_id, product_id, trades, matches, config)
+
+
+def _resume_group_scan(
+    account_id: str,
+    product_id: str,
+    trades: List[TransactionEvent],
+    config: WashTradingConfig,
+    previous: _GroupScanState | None,
+) -> Tuple[List[SuspiciousSequence], _GroupScanState]:
+    """
+    Detect wash trading for a group, reusing closed windows from a previous scan.
     
-    # For each trade, create a sliding window starting at that trade
-    for start_idx in range(len(trades)):
-        start_trade = trades[start_idx]
-        window_start = start_trade.timestamp
-        
-        # Collect all trades within the window using sliding window helper
-        window_trades = _collect_window_trades(trades, start_idx, config.window_size)
-        
-        # Validate window against all criteria using validation helper
-        is_valid, buy_trades, sell_trades = _validate_wash_trading_window(window_trades, config)
-        
-        if not is_valid:
-            continue
-        
-        # Calculate buy and sell quantities
-        total_buy_qty = sum(t.quantity for t in buy_trades)
-        total_sell_qty = sum(t.quantity for t in sell_trades)
-        
-        # Calculate optional price change percentage
-        price_change_pct = _calculate_price_change_percentage(window_trades)
-        
-        # Calculate alternation percentage (already validated, but needed for sequence)
-        alternation_pct = _calculate_alternation_percentage(window_trades)
-        
-        # Create suspicious sequence
-        sequences.append(
-            SuspiciousSequence(
-                account_id=account_id,
-                product_id=product_id,
-                start_timestamp=window_start,
-                end_timestamp=window_trades[-1].timestamp,  # Last trade in window
-                total_buy_qty=total_buy_qty,
-                total_sell_qty=total_sell_qty,
-                detection_type="WASH_TRADING",
-                side=None,  # Not applicable for wash trading
-                num_cancelled_orders=None,  # Not applicable for wash trading
-                order_timestamps=None,  # Not applicable for wash trading
-                alternation_percentage=alternation_pct,
-                price_change_percentage=price_change_pct if price_change_pct is not None and price_change_pct >= config.optional_price_change_threshold else None,
-            )
-        )
+    Args:
+        account_id: Account identifier.
+        product_id: Product identifier.
+        trades: List of TRADE_EXECUTED events, sorted by timestamp (non-empty).
+        config: Wash trading detection configuration.
+        previous: Scan state from the previous run for this group, if any.
+    
+    Returns:
+        Tuple of (sequences, state): all sequences for the group and the scan
+        state to resume from on the next run.
+    """
+    # Unchanged group (same fingerprint as the last run): nothing to scan
+    if (
+        previous is not None
+        and len(trades) == previous.trade_count
+        and trades[-1] == previous.last_trade
+    ):
+        return previous.sequences, previous
+    
+    resume_idx = 0
+    sequences: List[SuspiciousSequence] = []
     
-    return sequences
+    # Resume only if the group is an extension of the previously scanned trades
+    if (
+        previous is not None
+        and len(trades) >= previous.trade_count
+        and trades[previous.trade_count - 1] == previous.last_trade
+    ):
+        resume_idx = previous.open_start_idx
+        sequences.extend(previous.closed_sequences)
+    
+    # Windows starting at resume_idx only contain trades from resume_idx onwards
+    sequences.extend(
+        _detect_wash_trading_for_group(account_id, product_id, trades[resume_idx:], config)
+    )
+    
+    # Windows starting before open_start_idx end before the last trade
+    last_timestamp = trades[-1].timestamp
+    open_start_idx = bisect_left(
+        trades, last_timestamp - config.window_size, key=attrgetter("timestamp")
+    )
+    open_start_timestamp = trades[open_start_idx].timestamp
+    closed_sequences = [s for s in sequences if s.start_timestamp < open_start_timestamp]
+    
+    return sequences, _GroupScanState(
+        trade_count=len(trades),
+        last_trade=trades[-1],
+        open_start_idx=open_start_idx,
+        closed_sequences=closed_sequences,
+        sequences=sequences,
+    )
 
 
 def detect_wash_trading(
     events: Iterable[TransactionEvent],
     config: WashTradingConfig | None = None,
+    state: WashTradingScanState | None = None,
+    max_workers: int | None = None,
 ) -> List[SuspiciousSequence]:
     """
     Detect wash trading patterns in transaction events.
@@ -280,11 +656,23 @@ def detect_wash_trading(
             Events should be pre-filtered by the caller (algorithm wrapper).
         config: Optional wash trading detection configuration. If None, uses default
             WashTradingConfig() with standard thresholds.
+        state: Optional scan state for append-only event streams. When provided,
+            closed windows from the previous call are reused and the state is
+            updated in place for the next call. See WashTradingScanState.
+        max_workers: Optional number of worker processes. When greater than 1,
+            (account_id, product_id) groups are detected in parallel in a
+            ProcessPoolExecutor; results keep the serial group order. Only
+            the per-trade columns are sent to workers, and inputs with fewer
+            than two eligible groups stay serial. Ignored when `state` is
+            given. Defaults to None (serial detection).
     
     Returns:
         List of detected suspicious wash trading sequences.
         Empty list if no sequences detected.
     
+    Raises:
+        ValueError: If max_workers is given and not positive.
+    
     Example:
         >>> events = [
         ...     TransactionEvent(
@@ -304,16 +692,76 @@ def detect_wash_trading(
     """
     if config is None:
         config = WashTradingConfig()
+    if max_workers is not None:
+        validate_positive(max_workers, "max_workers")
     
     # Group by (account_id, product_id)
     grouped = group_events_by_account_product(events)
     
     all_sequences: List[SuspiciousSequence] = []
     
-    # Process each group
-    for (account_id, product_id), group_trades in grouped.items():
-        all_sequences.extend(
-            _detect_wash_trading_for_group(account_id, product_id, group_trades, config)
+    if state is None and max_workers is not None and max_workers > 1:
+        # Groups that cannot hold a valid window are not worth shipping to a worker
+        candidates = [
+            (key, group_trades)
+            for key, group_trades in grouped.items()
+            if _can_hold_window(group_trades, config)
+        ]
+        if len(candidates) > 1:
+            # Groups are independent: scan their columns in worker processes and
+            # build the sequences here, so only ints and tuples are pickled
+            columns = [_group_columns(group_trades) for _, group_trades in candidates]
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                chunksize = max(1, len(columns) // (max_workers * 4))
+                group_matches = executor.map(
+                    _scan_group_columns, columns, repeat(config), chunksize=chunksize
+                )
+                for ((account_id, product_id), group_trades), matches in zip(
+                    candidates, group_matches
+                ):
+                    group_sequences = _build_sequences(
+                        account_id, product_id, group_trades, matches, config
+                    )
+                    if config.overlap_policy == "dedupe":
+                        group_sequences = _dedupe_overlapping_sequences(group_sequences)
+                    all_sequences.extend(group_sequences)
+            return all_sequences
+    
+    if state is None:
+        # Process each group
+        for (account_id, product_id), group_trades in grouped.items():
+            group_sequences = _detect_wash_trading_for_group(
+                account_id, product_id, group_trades, config
+            )
+            if config.overlap_policy == "dedupe":
+                group_sequences = _dedupe_overlapping_sequences(group_sequences)
+            all_sequences.extend(group_sequences)
+        return all_sequences
+    
+    if state.config != config:
+        # Cached results are only valid for the config they were computed with
+        state.config = config
+        state.groups = {}
+    
+    # The state keeps every valid window: skipping depends on windows reported
+    # before the resume point, so it is applied to the merged result instead
+    scan_config = config
+    if config.overlap_policy == "skip":
+        scan_config = replace(config, overlap_policy="all")
+    
+    # Groups missing from this call are dropped from the state
+    previous_groups = state.groups
+    state.groups = {}
+    for key, group_trades in grouped.items():
+        account_id, product_id = key
+        # The state keeps every window; dedupe needs the full chain of overlaps
+        group_sequences, state.groups[key] = _resume_group_scan(
+            account_id, product_id, group_trades, scan_config, previous_groups.get(key)
         )
+        if config.overlap_policy == "skip":
+            group_sequences = _skip_overlapping_sequences(group_sequences)
+        elif config.overlap_policy == "dedupe":
+            group_sequences = _dedupe_overlapping_sequences(group_sequences)
+        all_sequences.extend(group_sequences)
     
     return all_sequences
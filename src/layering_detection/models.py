@@ -7,22 +7,33 @@ to keep dependencies minimal and make reasoning/testing straightforward.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from decimal import Decimal
 from typing import Literal
 
-from .utils.detection_utils import validate_positive
+from .utils.detection_utils import to_epoch_microseconds, validate_positive
 
 
 Side = Literal["BUY", "SELL"]
 EventType = Literal["ORDER_PLACED", "ORDER_CANCELLED", "TRADE_EXECUTED"]
+OverlapPolicy = Literal["all", "dedupe", "skip"]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TransactionEvent:
     """
     Single row from `transactions.csv`, represented as a typed domain object.
+
+    Uses ``__slots__`` since events are created in bulk (one per CSV row / DTO)
+    and carry no per-instance ``__dict__``. Field validation happens at ingress
+    (CSV parsing, Pydantic DTOs), not here.
+
+    ``timestamp_us`` derives integer microseconds since the Unix epoch from
+    ``timestamp`` (see ``to_epoch_microseconds()``) on first access and caches
+    it on the instance, so detectors can compare times as plain integers
+    without converting again on every run. The cache is not an init argument
+    and does not take part in equality.
     """
 
     timestamp: datetime
@@ -32,6 +43,17 @@ class TransactionEvent:
     price: Decimal
     quantity: int
     event_type: EventType
+    _timestamp_us: int | None = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def timestamp_us(self) -> int:
+        """Timestamp as integer microseconds since the Unix epoch (cached)."""
+        timestamp_us = self._timestamp_us
+        if timestamp_us is None:
+            timestamp_us = to_epoch_microseconds(self.timestamp)
+            # Frozen instance: bypass the dataclass guard to fill the cache slot
+            object.__setattr__(self, "_timestamp_us", timestamp_us)
+        return timestamp_us
 
 
 @dataclass(frozen=True)
@@ -77,6 +99,9 @@ class WashTradingConfig:
     - min_total_volume: 10000 (minimum total volume required)
     - window_size: 30 minutes (sliding window size for detection)
     - optional_price_change_threshold: 1.0 (optional bonus threshold for price change percentage)
+    - overlap_policy: "all" (report every valid window). "dedupe" reports each run of
+      overlapping valid windows once, as its earliest-starting window; "skip" resumes
+      the scan after the end of each reported window, so reported windows never overlap
 
     All numeric thresholds must be positive (greater than zero). Negative or zero values
     will raise ValueError during initialization.
@@ -88,14 +113,16 @@ class WashTradingConfig:
     min_total_volume: int = 10000
     window_size: timedelta = timedelta(minutes=30)
     optional_price_change_threshold: float = 1.0
+    overlap_policy: OverlapPolicy = "all"
 
     def __post_init__(self) -> None:
         """
         Validate that all thresholds are positive (greater than zero).
 
         Raises:
-            ValueError: If any threshold is negative or zero, with a clear
-                message indicating which threshold is invalid.
+            ValueError: If any threshold is negative or zero, or overlap_policy
+                is not one of "all", "dedupe" or "skip", with a clear message
+                indicating which field is invalid.
         """
         validate_positive(self.min_buy_trades, "min_buy_trades")
         validate_positive(self.min_sell_trades, "min_sell_trades")
@@ -107,17 +134,23 @@ class WashTradingConfig:
         validate_positive(
             self.optional_price_change_threshold, "optional_price_change_threshold"
         )
+        if self.overlap_policy not in ("all", "dedupe", "skip"):
+            raise ValueError(
+                f"overlap_policy must be 'all', 'dedupe' or 'skip', got {self.overlap_policy!r}"
+            )
 
 
 DetectionType = Literal["LAYERING", "WASH_TRADING"]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SuspiciousSequence:
     """
     Represents a single detected suspicious sequence (layering or wash trading).
 
     Aggregated metrics (total_buy_qty, etc.) are computed at detection time.
+    Uses ``__slots__``: overlapping sliding windows can yield one instance per
+    trade in a group.
 
     Fields vary by detection type:
     - LAYERING: side, num_cancelled_orders, order_timestamps are required
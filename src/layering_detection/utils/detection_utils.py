@@ -8,7 +8,8 @@ to avoid code duplication and reduce coupling between modules.
 from __future__ import annotations
 
 from collections import defaultdict
-from datetime import timedelta
+from datetime import datetime, timedelta, timezone
+from operator import attrgetter
 from typing import TYPE_CHECKING, DefaultDict, Dict, Iterable, List, Tuple
 
 if TYPE_CHECKING:
@@ -16,6 +17,10 @@ if TYPE_CHECKING:
 
 AccountProductKey = Tuple[str, str]
 
+_EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_EPOCH_NAIVE = datetime(1970, 1, 1)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+
 
 def group_events_by_account_product(
     events: Iterable[TransactionEvent],
@@ -50,8 +55,11 @@ def group_events_by_account_product(
     for event in events:
         grouped[(event.account_id, event.product_id)].append(event)
 
-    for key in grouped:
-        grouped[key].sort(key=lambda e: e.timestamp)
+    # Per-group sorts are cheaper than one global (account, product, timestamp)
+    # sort, and attrgetter avoids a Python-level call per key
+    by_timestamp = attrgetter("timestamp")
+    for group in grouped.values():
+        group.sort(key=by_timestamp)
 
     return dict(grouped)
 
@@ -144,3 +152,33 @@ def get_opposite_side(side: "Side") -> "Side":
         'BUY'
     """
     return "SELL" if side == "BUY" else "BUY"
+
+
+def to_epoch_microseconds(timestamp: datetime) -> int:
+    """
+    Convert a datetime to integer microseconds since the Unix epoch.
+    
+    Used by detection algorithms to compare timestamps as plain integers in hot
+    loops instead of allocating timedelta objects on every subtraction.
+    Microseconds are the resolution of datetime, so the conversion is exact and
+    preserves ordering and equality (including inclusive window boundaries).
+    
+    Timezone-aware datetimes are converted via UTC. Naive datetimes are treated
+    as UTC (not local time) so that results do not depend on the host timezone
+    or DST transitions.
+    
+    Args:
+        timestamp: The datetime to convert (naive or timezone-aware).
+    
+    Returns:
+        Integer number of microseconds since 1970-01-01T00:00:00 UTC.
+    
+    Example:
+        >>> from datetime import datetime, timezone
+        >>> to_epoch_microseconds(datetime(1970, 1, 1, 0, 0, 1, tzinfo=timezone.utc))
+        1000000
+        >>> to_epoch_microseconds(datetime(1970, 1, 1, 0, 0, 1))
+        1000000
+    """
+    epoch = _EPOCH_NAIVE if timestamp.tzinfo is None else _EPOCH_UTC
+    return (timestamp - epoch) // _ONE_MICROSECOND
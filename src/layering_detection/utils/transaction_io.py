@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import csv
 import logging
+import sys
 from datetime import datetime
 from decimal import Decimal, InvalidOperation
 from pathlib import Path
@@ -35,13 +36,14 @@ def _parse_timestamp(raw: str) -> datetime:
 
 
 def _parse_side(raw: str) -> Side:
-    from typing import cast
-
     value = raw.strip().upper()
-    if value not in ("BUY", "SELL"):
-        raise ValueError(f"Invalid side: {raw!r}")
-    # Cast is safe after validation - value is guaranteed to be "BUY" or "SELL"
-    return cast(Side, value)
+    # Return the interned literals rather than the freshly built string so that
+    # downstream ``side == "BUY"`` checks short-circuit on identity.
+    if value == "BUY":
+        return "BUY"
+    if value == "SELL":
+        return "SELL"
+    raise ValueError(f"Invalid side: {raw!r}")
 
 
 def _parse_event_type(raw: str) -> EventType:
@@ -51,8 +53,9 @@ def _parse_event_type(raw: str) -> EventType:
     allowed: tuple[str, ...] = ("ORDER_PLACED", "ORDER_CANCELLED", "TRADE_EXECUTED")
     if value not in allowed:
         raise ValueError(f"Invalid event_type: {raw!r}")
-    # Cast is safe after validation - value is guaranteed to be one of the allowed types
-    return cast(EventType, value)
+    # Cast is safe after validation - value is guaranteed to be one of the allowed types.
+    # Interned like the side so event_type comparisons short-circuit on identity.
+    return cast(EventType, sys.intern(value))
 
 
 def _parse_price(raw: str) -> Decimal:
@@ -120,15 +123,16 @@ def read_transactions(path: Path) -> List[TransactionEvent]:
                 if not product_id:
                     raise ValueError("Empty product_id")
 
+                # Positional args in field order bind faster than keywords
                 events.append(
                     TransactionEvent(
-                        timestamp=timestamp,
-                        account_id=account_id,
-                        product_id=product_id,
-                        side=side,
-                        price=price,
-                        quantity=quantity,
-                        event_type=event_type,
+                        timestamp,
+                        account_id,
+                        product_id,
+                        side,
+                        price,
+                        quantity,
+                        event_type,
                     )
                 )
             except Exception as exc:
@@ -6,12 +6,15 @@ end-to-end integration. Unit tests for internal functions are in test_wash_tradi
 """
 
 from datetime import datetime, timedelta, timezone
-from decimal import Decimal
 
 import pytest
 
 from layering_detection.algorithms.registry import AlgorithmRegistry
-from layering_detection.models import SuspiciousSequence, TransactionEvent
+from layering_detection.models import SuspiciousSequence
+from tests.fixtures import (
+    create_trade_sequence,
+    create_transaction_event,
+)
 
 
 class TestWashTradingRegistryIntegration:
@@ -31,63 +34,7 @@ class TestWashTradingRegistryIntegration:
         """Test positive case using algorithm registry."""
         # Arrange
         algorithm = AlgorithmRegistry.get("wash_trading")
-        base_time = datetime(2025, 1, 1, 9, 0, 0, tzinfo=timezone.utc)
-        events = [
-            TransactionEvent(
-                timestamp=base_time,
-                account_id="ACC001",
-                product_id="IBM",
-                side="BUY",
-                price=Decimal("100.0"),
-                quantity=2000,
-                event_type="TRADE_EXECUTED",
-            ),
-            TransactionEvent(
-                timestamp=base_time + timedelta(minutes=5),
-                account_id="ACC001",
-                product_id="IBM",
-                side="SELL",
-                price=Decimal("100.5"),
-                quantity=2000,
-                event_type="TRADE_EXECUTED",
-            ),
-            TransactionEvent(
-                timestamp=base_time + timedelta(minutes=10),
-                account_id="ACC001",
-                product_id="IBM",
-                side="BUY",
-                price=Decimal("101.0"),
-                quantity=2000,
-                event_type="TRADE_EXECUTED",
-            ),
-            TransactionEvent(
-                timestamp=base_time + timedelta(minutes=15),
-                account_id="ACC001",
-                product_id="IBM",
-                side="SELL",
-                price=Decimal("101.5"),
-                quantity=2000,
-                event_type="TRADE_EXECUTED",
-            ),
-            TransactionEvent(
-                timestamp=base_time + timedelta(minutes=20),
-                account_id="ACC001",
-                product_id="IBM",
-                side="BUY",
-                price=Decimal("102.0"),
-                quantity=2000,
-                event_type="TRADE_EXECUTED",
-            ),
-            TransactionEvent(
-                timestamp=base_time + timedelta(minutes=25),
-                account_id="ACC001",
-                product_id="IBM",
-                side="SELL",
-                price=Decimal("102.5"),
-                quantity=2000,
-                event_type="TRADE_EXECUTED",
-            ),
-        ]
+        events = create_trade_sequence("BSBSBS", quantities=2000)
 
         # Act
         sequences = algorithm.detect(events)
@@ -100,63 +47,7 @@ class TestWashTradingRegistryIntegration:
         """Test integration: algorithm produces correct output format."""
         # Arrange
         algorithm = AlgorithmRegistry.get("wash_trading")
-        base_time = datetime(2025, 1, 1, 9, 0, 0, tzinfo=timezone.utc)
-        events = [
-            TransactionEvent(
-                timestamp=base_time,
-                account_id="ACC001",
-                product_id="IBM",
-                side="BUY",
-                price=Decimal("100.0"),
-                quantity=2000,
-                event_type="TRADE_EXECUTED",
-            ),
-            TransactionEvent(
-                timestamp=base_time + timedelta(minutes=5),
-                account_id="ACC001",
-                product_id="IBM",
-                side="SELL",
-                price=Decimal("100.5"),
-                quantity=2000,
-                event_type="TRADE_EXECUTED",
-            ),
-            TransactionEvent(
-                timestamp=base_time + timedelta(minutes=10),
-                account_id="ACC001",
-                product_id="IBM",
-                side="BUY",
-                price=Decimal("101.0"),
-                quantity=2000,
-                event_type="TRADE_EXECUTED",
-            ),
-            TransactionEvent(
-                timestamp=base_time + timedelta(minutes=15),
-                account_id="ACC001",
-                product_id="IBM",
-                side="SELL",
-                price=Decimal("101.5"),
-                quantity=2000,
-                event_type="TRADE_EXECUTED",
-            ),
-            TransactionEvent(
-                timestamp=base_time + timedelta(minutes=20),
-                account_id="ACC001",
-                product_id="IBM",
-                side="BUY",
-                price=Decimal("102.0"),
-                quantity=2000,
-                event_type="TRADE_EXECUTED",
-            ),
-            TransactionEvent(
-                timestamp=base_time + timedelta(minutes=25),
-                account_id="ACC001",
-                product_id="IBM",
-                side="SELL",
-                price=Decimal("102.5"),
-                quantity=2000,
-                event_type="TRADE_EXECUTED",
-            ),
-        ]
+        events = create_trade_sequence("BSBSBS", quantities=2000)
 
         # Act
         sequences = algorithm.detect(events)
@@ -183,33 +74,15 @@ class TestWashTradingRegistryIntegration:
         algorithm = AlgorithmRegistry.get("wash_trading")
         base_time = datetime(2025, 1, 1, 9, 0, 0, tzinfo=timezone.utc)
         events = [
-            TransactionEvent(
-                timestamp=base_time,
-                account_id="ACC001",
-                product_id="IBM",
-                side="BUY",
-                price=Decimal("100.0"),
-                quantity=2000,
-                event_type="ORDER_PLACED",
-            ),
-            TransactionEvent(
-                timestamp=base_time + timedelta(minutes=5),
-                account_id="ACC001",
-                product_id="IBM",
-                side="BUY",
-                price=Decimal("100.0"),
-                quantity=2000,
-                event_type="TRADE_EXECUTED",
-            ),
-            TransactionEvent(
-                timestamp=base_time + timedelta(minutes=10),
-                account_id="ACC001",
-                product_id="IBM",
-                side="BUY",
-                price=Decimal("100.0"),
-                quantity=2000,
-                event_type="ORDER_CANCELLED",
-            ),
+            create_transaction_event(
+                timestamp=base_time + timedelta(minutes=5 * i),
+                price="100.0",
+                quantity=2000,
+                event_type=event_type,
+            )
+            for i, event_type in enumerate(
+                ("ORDER_PLACED", "TRADE_EXECUTED", "ORDER_CANCELLED")
+            )
         ]
 
         # Act
@@ -230,129 +103,43 @@ class TestWashTradingMultiAlgorithmIntegration:
         base_time = datetime(2025, 1, 1, 9, 0, 0, tzinfo=timezone.utc)
 
         # Layering events (ORDER_PLACED, ORDER_CANCELLED, TRADE_EXECUTED)
+        # (orders at 0/2/4s, cancels at 6/7/8s, opposite trade at 9s)
         layering_events = [
-            TransactionEvent(
-                timestamp=base_time,
-                account_id="ACC001",
-                product_id="IBM",
-                side="BUY",
-                price=Decimal("100.0"),
-                quantity=1000,
-                event_type="ORDER_PLACED",
-            ),
-            TransactionEvent(
-                timestamp=base_time + timedelta(seconds=2),
-                account_id="ACC001",
-                product_id="IBM",
-                side="BUY",
-                price=Decimal("100.0"),
-                quantity=1000,
-                event_type="ORDER_PLACED",
-            ),
-            TransactionEvent(
-                timestamp=base_time + timedelta(seconds=4),
-                account_id="ACC001",
-                product_id="IBM",
-                side="BUY",
-                price=Decimal("100.0"),
-                quantity=1000,
-                event_type="ORDER_PLACED",
-            ),
-            TransactionEvent(
-                timestamp=base_time + timedelta(seconds=6),
-                account_id="ACC001",
-                product_id="IBM",
+            create_transaction_event(
+                timestamp=base_time + timedelta(seconds=offset),
                 side="BUY",
-                price=Decimal("100.0"),
+                price="100.0",
                 quantity=1000,
-                event_type="ORDER_CANCELLED",
-            ),
-            TransactionEvent(
-                timestamp=base_time + timedelta(seconds=7),
-                account_id="ACC001",
-                product_id="IBM",
-                side="BUY",
-                price=Decimal("100.0"),
-                quantity=1000,
-                event_type="ORDER_CANCELLED",
-            ),
-            TransactionEvent(
-                timestamp=base_time + timedelta(seconds=8),
-                account_id="ACC001",
-                product_id="IBM",
-                side="BUY",
-                price=Decimal("100.0"),
-                quantity=1000,
-                event_type="ORDER_CANCELLED",
-            ),
-            TransactionEvent(
+                event_type=event_type,
+            )
+            for offset, event_type in (
+                (0, "ORDER_PLACED"),
+                (2, "ORDER_PLACED"),
+                (4, "ORDER_PLACED"),
+                (6, "ORDER_CANCELLED"),
+                (7, "ORDER_CANCELLED"),
+                (8, "ORDER_CANCELLED"),
+            )
+        ]
+        layering_events.append(
+            create_transaction_event(
                 timestamp=base_time + timedelta(seconds=9),
-                account_id="ACC001",
-                product_id="IBM",
                 side="SELL",
-                price=Decimal("100.5"),
+                price="100.5",
                 quantity=500,
                 event_type="TRADE_EXECUTED",
-            ),
-        ]
+            )
+        )
 
         # Wash trading events (only TRADE_EXECUTED)
-        wash_trading_events = [
-            TransactionEvent(
-                timestamp=base_time,
-                account_id="ACC002",
-                product_id="AAPL",
-                side="BUY",
-                price=Decimal("150.0"),
-                quantity=2000,
-                event_type="TRADE_EXECUTED",
-            ),
-            TransactionEvent(
-                timestamp=base_time + timedelta(minutes=5),
-                account_id="ACC002",
-                product_id="AAPL",
-                side="SELL",
-                price=Decimal("150.5"),
-                quantity=2000,
-                event_type="TRADE_EXECUTED",
-            ),
-            TransactionEvent(
-                timestamp=base_time + timedelta(minutes=10),
-                account_id="ACC002",
-                product_id="AAPL",
-                side="BUY",
-                price=Decimal("151.0"),
-                quantity=2000,
-                event_type="TRADE_EXECUTED",
-            ),
-            TransactionEvent(
-                timestamp=base_time + timedelta(minutes=15),
-                account_id="ACC002",
-                product_id="AAPL",
-                side="SELL",
-                price=Decimal("151.5"),
-                quantity=2000,
-                event_type="TRADE_EXECUTED",
-            ),
-            TransactionEvent(
-                timestamp=base_time + timedelta(minutes=20),
-                account_id="ACC002",
-                product_id="AAPL",
-                side="BUY",
-                price=Decimal("152.0"),
-                quantity=2000,
-                event_type="TRADE_EXECUTED",
-            ),
-            TransactionEvent(
-                timestamp=base_time + timedelta(minutes=25),
-                account_id="ACC002",
-                product_id="AAPL",
-                side="SELL",
-                price=Decimal("152.5"),
-                quantity=2000,
-                event_type="TRADE_EXECUTED",
-            ),
-        ]
+        wash_trading_events = create_trade_sequence(
+            "BSBSBS",
+            quantities=2000,
+            prices=["150.0", "150.5", "151.0", "151.5", "152.0", "152.5"],
+            base_time=base_time,
+            account_id="ACC002",
+            product_id="AAPL",
+        )
 
         # Act
         layering_sequences = layering_alg.detect(layering_events)
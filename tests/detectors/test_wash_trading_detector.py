@@ -5,316 +5,114 @@ Tests core wash trading detection logic including filtering, grouping,
 sliding windows, alternation calculation, and detection conditions.
 """
 
+import random
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 
 import pytest
 
 from layering_detection.models import TransactionEvent, WashTradingConfig
+from layering_detection.detectors import wash_trading_detector
 from layering_detection.detectors.wash_trading_detector import (
+    WashTradingScanState,
     _calculate_alternation_percentage,
     _calculate_price_change_percentage,
     _collect_window_trades,
     _detect_wash_trading_for_group,
+    _scan_windows,
     _validate_wash_trading_window,
     detect_wash_trading,
 )
-from tests.fixtures import create_transaction_event, create_wash_trading_pattern
-
-
-class TestAlternationPercentageCalculation:
-    """Test suite for alternation percentage calculation."""
-
-    def test_perfect_alternation_100_percent(self) -> None:
-        """Test that perfect alternation (BUY, SELL, BUY, SELL) gives 100%."""
-        # Arrange
-        base_time = datetime(2025, 1, 1, 9, 0, 0, tzinfo=timezone.utc)
-        trades = [
-            create_transaction_event(
-                timestamp=base_time,
-                side="BUY",
-                price="100.0",
-                quantity=1000,
-                event_type="TRADE_EXECUTED",
-            ),
-            create_transaction_event(
-                timestamp=base_time + timedelta(minutes=5),
-                side="SELL",
-                price="100.5",
-                quantity=1000,
-                event_type="TRADE_EXECUTED",
-            ),
-            create_transaction_event(
-                timestamp=base_time + timedelta(minutes=10),
-                side="BUY",
-                price="101.0",
-                quantity=1000,
-                event_type="TRADE_EXECUTED",
-            ),
-            create_transaction_event(
-                timestamp=base_time + timedelta(minutes=15),
-                side="SELL",
-                price="101.5",
-                quantity=1000,
-                event_type="TRADE_EXECUTED",
-            ),
-        ]
+from tests.fixtures import (
+    create_trade_sequence,
+    create_transaction_event,
+    create_wash_trading_pattern,
+)
 
-        # Act
-        alternation = _calculate_alternation_percentage(trades)
+# Shared start time for test trades (built once at import rather than per test)
+_BASE_TIME = datetime(2025, 1, 1, 9, 0, 0, tzinfo=timezone.utc)
 
-        # Assert
-        assert alternation == 100.0
+# Default thresholds; the config is frozen, so one instance serves every test
+_DEFAULT_CONFIG = WashTradingConfig()
 
-    def test_no_alternation_0_percent(self) -> None:
-        """Test that no alternation (all BUY) gives 0%."""
-        # Arrange
-        base_time = datetime(2025, 1, 1, 9, 0, 0, tzinfo=timezone.utc)
-        trades = [
-            create_transaction_event(
-                timestamp=base_time,
-                side="BUY",
-                price="100.0",
-                quantity=1000,
-                event_type="TRADE_EXECUTED",
-            ),
-            create_transaction_event(
-                timestamp=base_time + timedelta(minutes=5),
-                side="BUY",
-                price="100.5",
-                quantity=1000,
-                event_type="TRADE_EXECUTED",
-            ),
-            create_transaction_event(
-                timestamp=base_time + timedelta(minutes=10),
-                side="BUY",
-                price="101.0",
-                quantity=1000,
-                event_type="TRADE_EXECUTED",
-            ),
-        ]
 
-        # Act
-        alternation = _calculate_alternation_percentage(trades)
+@pytest.fixture(scope="module")
+def valid_pattern() -> tuple[TransactionEvent, ...]:
+    """
+    Valid 6-trade wash trading pattern for ACC001/IBM starting at _BASE_TIME.
+    
+    Module-scoped: events are frozen and the tuple cannot be mutated, so tests
+    share one instance. Use list(valid_pattern) to extend it.
+    """
+    return tuple(create_wash_trading_pattern(base_time=_BASE_TIME, quantity=2000))
 
-        # Assert
-        assert alternation == 0.0
 
-    def test_partial_alternation_50_percent(self) -> None:
-        """Test that partial alternation gives correct percentage."""
-        # Arrange: BUY, BUY, SELL, SELL = 1 switch / 3 transitions = 33.33%
-        base_time = datetime(2025, 1, 1, 9, 0, 0, tzinfo=timezone.utc)
-        trades = [
-            create_transaction_event(
-                timestamp=base_time,
-                side="BUY",
-                price="100.0",
-                quantity=1000,
-                event_type="TRADE_EXECUTED",
-            ),
-            create_transaction_event(
-                timestamp=base_time + timedelta(minutes=5),
-                side="BUY",
-                price="100.5",
-                quantity=1000,
-                event_type="TRADE_EXECUTED",
-            ),
-            create_transaction_event(
-                timestamp=base_time + timedelta(minutes=10),
-                side="SELL",
-                price="101.0",
-                quantity=1000,
-                event_type="TRADE_EXECUTED",
-            ),
-            create_transaction_event(
-                timestamp=base_time + timedelta(minutes=15),
-                side="SELL",
-                price="101.5",
-                quantity=1000,
-                event_type="TRADE_EXECUTED",
-            ),
-        ]
-
-        # Act
-        alternation = _calculate_alternation_percentage(trades)
-
-        # Assert
-        assert alternation == pytest.approx(33.333, abs=0.1)
+class TestAlternationPercentageCalculation:
+    """Test suite for alternation percentage calculation."""
 
-    def test_single_trade_returns_zero(self) -> None:
-        """Test that single trade returns 0% alternation."""
+    @pytest.mark.parametrize(
+        ("sides", "expected"),
+        [
+            pytest.param("BSBS", 100.0, id="perfect_alternation_100_percent"),
+            pytest.param("BBB", 0.0, id="no_alternation_0_percent"),
+            # 1 switch / 3 transitions
+            pytest.param("BBSS", 33.333, id="partial_alternation_33_percent"),
+            pytest.param("B", 0.0, id="single_trade_returns_zero"),
+            pytest.param("", 0.0, id="empty_list_returns_zero"),
+            # BUY->BUY, BUY->SELL, SELL->BUY, BUY->SELL, SELL->SELL: 3 switches / 5 transitions
+            pytest.param("BBSBSS", 60.0, id="exactly_60_percent_alternation"),
+        ],
+    )
+    def test_alternation_percentage(self, sides: str, expected: float) -> None:
+        """Test alternation percentage for a side pattern."""
         # Arrange
-        base_time = datetime(2025, 1, 1, 9, 0, 0, tzinfo=timezone.utc)
-        trades = [
-            create_transaction_event(
-                timestamp=base_time,
-                side="BUY",
-                price="100.0",
-                quantity=1000,
-                event_type="TRADE_EXECUTED",
-            ),
-        ]
+        trades = create_trade_sequence(sides)
 
         # Act
         alternation = _calculate_alternation_percentage(trades)
 
         # Assert
-        assert alternation == 0.0
+        assert alternation == pytest.approx(expected, abs=0.1)
 
-    def test_empty_list_returns_zero(self) -> None:
-        """Test that empty list returns 0% alternation."""
+    def test_alternation_matches_definition_for_random_patterns(self) -> None:
+        """Test alternation against its definition on seeded random side patterns."""
         # Arrange
-        trades: list[TransactionEvent] = []
+        rng = random.Random(2020)
+        patterns = ["".join(rng.choice("BS") for _ in range(rng.randint(2, 64))) for _ in range(100)]
 
-        # Act
-        alternation = _calculate_alternation_percentage(trades)
+        for sides in patterns:
+            trades = create_trade_sequence(sides)
+            switches = sum(a != b for a, b in zip(sides, sides[1:]))
 
-        # Assert
-        assert alternation == 0.0
-
-    def test_exactly_60_percent_alternation(self) -> None:
-        """Test that exactly 60% alternation is calculated correctly."""
-        # Arrange: 6 trades with 3 switches = 3/5 = 60%
-        # Pattern: BUY, SELL, BUY, SELL, BUY, SELL = 5 switches (wrong)
-        # Pattern: BUY, BUY, SELL, BUY, SELL, SELL = 3 switches / 5 transitions = 60%
-        base_time = datetime(2025, 1, 1, 9, 0, 0, tzinfo=timezone.utc)
-        trades = [
-            create_transaction_event(
-                timestamp=base_time,
-                side="BUY",
-                price="100.0",
-                quantity=1000,
-                event_type="TRADE_EXECUTED",
-            ),
-            create_transaction_event(
-                timestamp=base_time + timedelta(minutes=5),
-                side="BUY",
-                price="100.5",
-                quantity=1000,
-                event_type="TRADE_EXECUTED",
-            ),
-            create_transaction_event(
-                timestamp=base_time + timedelta(minutes=10),
-                side="SELL",
-                price="101.0",
-                quantity=1000,
-                event_type="TRADE_EXECUTED",
-            ),
-            create_transaction_event(
-                timestamp=base_time + timedelta(minutes=15),
-                side="BUY",
-                price="101.5",
-                quantity=1000,
-                event_type="TRADE_EXECUTED",
-            ),
-            create_transaction_event(
-                timestamp=base_time + timedelta(minutes=20),
-                side="SELL",
-                price="102.0",
-                quantity=1000,
-                event_type="TRADE_EXECUTED",
-            ),
-            create_transaction_event(
-                timestamp=base_time + timedelta(minutes=25),
-                side="SELL",
-                price="102.5",
-                quantity=1000,
-                event_type="TRADE_EXECUTED",
-            ),
-        ]
-
-        # Act
-        alternation = _calculate_alternation_percentage(trades)
+            # Act
+            alternation = _calculate_alternation_percentage(trades)
 
-        # Assert: 3 switches / 5 transitions = 60%
-        # Switches: BUY->BUY (0), BUY->SELL (1), SELL->BUY (2), BUY->SELL (3), SELL->SELL (0)
-        # Total: 3 switches out of 5 transitions = 60%
-        assert alternation == pytest.approx(60.0, abs=0.1)
+            # Assert
+            assert alternation == switches / (len(sides) - 1) * 100.0, sides
 
 
 class TestPriceChangePercentageCalculation:
     """Test suite for price change percentage calculation."""
 
-    def test_price_increase_calculated_correctly(self) -> None:
-        """Test that price increase is calculated correctly."""
+    @pytest.mark.parametrize(
+        ("prices", "expected"),
+        [
+            pytest.param(["100.0", "101.0"], 1.0, id="price_increase"),
+            # Absolute value
+            pytest.param(["100.0", "99.0"], 1.0, id="price_decrease"),
+            pytest.param(["100.0", "100.0"], 0.0, id="no_price_change_returns_zero"),
+        ],
+    )
+    def test_price_change_percentage(self, prices: list[str], expected: float) -> None:
+        """Test price change percentage between the first and last trade."""
         # Arrange
-        base_time = datetime(2025, 1, 1, 9, 0, 0, tzinfo=timezone.utc)
-        trades = [
-            create_transaction_event(
-                timestamp=base_time,
-                side="BUY",
-                price="100.0",
-                quantity=1000,
-                event_type="TRADE_EXECUTED",
-            ),
-            create_transaction_event(
-                timestamp=base_time + timedelta(minutes=15),
-                side="SELL",
-                price="101.0",
-                quantity=1000,
-                event_type="TRADE_EXECUTED",
-            ),
-        ]
-
-        # Act
-        price_change = _calculate_price_change_percentage(trades)
-
-        # Assert
-        assert price_change == pytest.approx(1.0, abs=0.01)
-
-    def test_price_decrease_calculated_correctly(self) -> None:
-        """Test that price decrease is calculated correctly (absolute value)."""
-        # Arrange
-        base_time = datetime(2025, 1, 1, 9, 0, 0, tzinfo=timezone.utc)
-        trades = [
-            create_transaction_event(
-                timestamp=base_time,
-                side="BUY",
-                price="100.0",
-                quantity=1000,
-                event_type="TRADE_EXECUTED",
-            ),
-            create_transaction_event(
-                timestamp=base_time + timedelta(minutes=15),
-                side="SELL",
-                price="99.0",
-                quantity=1000,
-                event_type="TRADE_EXECUTED",
-            ),
-        ]
-
-        # Act
-        price_change = _calculate_price_change_percentage(trades)
-
-        # Assert
-        assert price_change == pytest.approx(1.0, abs=0.01)
-
-    def test_no_price_change_returns_zero(self) -> None:
-        """Test that no price change returns 0%."""
-        # Arrange
-        base_time = datetime(2025, 1, 1, 9, 0, 0, tzinfo=timezone.utc)
-        trades = [
-            create_transaction_event(
-                timestamp=base_time,
-                side="BUY",
-                price="100.0",
-                quantity=1000,
-                event_type="TRADE_EXECUTED",
-            ),
-            create_transaction_event(
-                timestamp=base_time + timedelta(minutes=15),
-                side="SELL",
-                price="100.0",
-                quantity=1000,
-                event_type="TRADE_EXECUTED",
-            ),
-        ]
+        trades = create_trade_sequence("BS", prices=prices, time_interval_minutes=15)
 
         # Act
         price_change = _calculate_price_change_percentage(trades)
 
         # Assert
-        assert price_change == pytest.approx(0.0, abs=0.01)
+        assert price_change == pytest.approx(expected, abs=0.01)
 
     def test_empty_list_returns_none(self) -> None:
         """Test that empty list returns None."""
@@ -334,7 +132,7 @@ class TestCollectWindowTrades:
     def test_collects_trades_within_window(self) -> None:
         """Test that trades within the window are collected correctly."""
         # Arrange
-        base_time = datetime(2025, 1, 1, 9, 0, 0, tzinfo=timezone.utc)
+        base_time = _BASE_TIME
         trades = [
             create_transaction_event(
                 timestamp=base_time,
@@ -379,7 +177,7 @@ class TestCollectWindowTrades:
     def test_window_boundary_inclusive(self) -> None:
         """Test that trades exactly at window boundary are included."""
         # Arrange
-        base_time = datetime(2025, 1, 1, 9, 0, 0, tzinfo=timezone.utc)
+        base_time = _BASE_TIME
         window_size = timedelta(minutes=30)
         trades = [
             create_transaction_event(
@@ -416,7 +214,7 @@ class TestCollectWindowTrades:
     def test_window_boundary_exclusive(self) -> None:
         """Test that trades just after window boundary are excluded."""
         # Arrange
-        base_time = datetime(2025, 1, 1, 9, 0, 0, tzinfo=timezone.utc)
+        base_time = _BASE_TIME
         window_size = timedelta(minutes=30)
         trades = [
             create_transaction_event(
@@ -457,7 +255,7 @@ class TestCollectWindowTrades:
     def test_start_idx_out_of_bounds_returns_empty(self) -> None:
         """Test that start_idx beyond list length returns empty."""
         # Arrange
-        base_time = datetime(2025, 1, 1, 9, 0, 0, tzinfo=timezone.utc)
+        base_time = _BASE_TIME
         trades = [
             create_transaction_event(
                 timestamp=base_time,
@@ -478,7 +276,7 @@ class TestCollectWindowTrades:
     def test_middle_start_idx_collects_from_that_point(self) -> None:
         """Test that starting from middle index collects trades from that point."""
         # Arrange
-        base_time = datetime(2025, 1, 1, 9, 0, 0, tzinfo=timezone.utc)
+        base_time = _BASE_TIME
         trades = [
             create_transaction_event(
                 timestamp=base_time,
@@ -515,7 +313,7 @@ class TestCollectWindowTrades:
     def test_all_trades_within_window(self) -> None:
         """Test that all trades are collected when all are within window."""
         # Arrange
-        base_time = datetime(2025, 1, 1, 9, 0, 0, tzinfo=timezone.utc)
+        base_time = _BASE_TIME
         trades = [
             create_transaction_event(
                 timestamp=base_time,
@@ -546,7 +344,7 @@ class TestCollectWindowTrades:
 
         # Assert
         assert len(window_trades) == 3
-        assert all(trade in window_trades for trade in trades)
+        assert [id(trade) for trade in window_trades] == [id(trade) for trade in trades]
 
 
 class TestValidateWashTradingWindow:
@@ -555,9 +353,9 @@ class TestValidateWashTradingWindow:
     def test_valid_window_passes_all_checks(self) -> None:
         """Test that a valid window passes all validation checks."""
         # Arrange
-        base_time = datetime(2025, 1, 1, 9, 0, 0, tzinfo=timezone.utc)
+        base_time = _BASE_TIME
         window_trades = create_wash_trading_pattern(base_time=base_time, quantity=2500)  # 6 trades * 2500 = 15000 volume
-        config = WashTradingConfig()
+        config = _DEFAULT_CONFIG
 
         # Act
         is_valid, buy_trades, sell_trades = _validate_wash_trading_window(window_trades, config)
@@ -572,7 +370,7 @@ class TestValidateWashTradingWindow:
     def test_insufficient_total_trades_fails(self) -> None:
         """Test that window with insufficient total trades fails validation."""
         # Arrange
-        base_time = datetime(2025, 1, 1, 9, 0, 0, tzinfo=timezone.utc)
+        base_time = _BASE_TIME
         window_trades = [
             create_transaction_event(
                 timestamp=base_time,
@@ -589,7 +387,7 @@ class TestValidateWashTradingWindow:
                 event_type="TRADE_EXECUTED",
             ),
         ]  # Only 2 trades, need at least 6 (3+3)
-        config = WashTradingConfig()
+        config = _DEFAULT_CONFIG
 
         # Act
         is_valid, buy_trades, sell_trades = _validate_wash_trading_window(window_trades, config)
@@ -603,7 +401,7 @@ class TestValidateWashTradingWindow:
     def test_insufficient_buy_trades_fails(self) -> None:
         """Test that window with insufficient buy trades fails validation."""
         # Arrange
-        base_time = datetime(2025, 1, 1, 9, 0, 0, tzinfo=timezone.utc)
+        base_time = _BASE_TIME
         window_trades = [
             create_transaction_event(
                 timestamp=base_time,
@@ -648,7 +446,7 @@ class TestValidateWashTradingWindow:
                 event_type="TRADE_EXECUTED",
             ),
         ]  # 2 buy trades, 4 sell trades (total 6, but only 2 buy trades, need 3)
-        config = WashTradingConfig()
+        config = _DEFAULT_CONFIG
 
         # Act
         is_valid, buy_trades, sell_trades = _validate_wash_trading_window(window_trades, config)
@@ -661,7 +459,7 @@ class TestValidateWashTradingWindow:
     def test_insufficient_sell_trades_fails(self) -> None:
         """Test that window with insufficient sell trades fails validation."""
         # Arrange
-        base_time = datetime(2025, 1, 1, 9, 0, 0, tzinfo=timezone.utc)
+        base_time = _BASE_TIME
         window_trades = [
             create_transaction_event(
                 timestamp=base_time,
@@ -706,7 +504,7 @@ class TestValidateWashTradingWindow:
                 event_type="TRADE_EXECUTED",
             ),
         ]  # 4 buy trades, 2 sell trades (total 6, but only 2 sell trades, need 3)
-        config = WashTradingConfig()
+        config = _DEFAULT_CONFIG
 
         # Act
         is_valid, buy_trades, sell_trades = _validate_wash_trading_window(window_trades, config)
@@ -719,10 +517,10 @@ class TestValidateWashTradingWindow:
     def test_insufficient_volume_fails(self) -> None:
         """Test that window with insufficient volume fails validation."""
         # Arrange
-        base_time = datetime(2025, 1, 1, 9, 0, 0, tzinfo=timezone.utc)
+        base_time = _BASE_TIME
         # Create pattern with low volume: 6 trades * 800 = 4800 (below minimum of 10000)
         window_trades = create_wash_trading_pattern(base_time=base_time, quantity=800)
-        config = WashTradingConfig()
+        config = _DEFAULT_CONFIG
 
         # Act
         is_valid, buy_trades, sell_trades = _validate_wash_trading_window(window_trades, config)
@@ -735,7 +533,7 @@ class TestValidateWashTradingWindow:
     def test_insufficient_alternation_fails(self) -> None:
         """Test that window with insufficient alternation fails validation."""
         # Arrange
-        base_time = datetime(2025, 1, 1, 9, 0, 0, tzinfo=timezone.utc)
+        base_time = _BASE_TIME
         # Create pattern with low alternation: BUY, BUY, BUY, SELL, SELL, SELL = 1 switch / 5 transitions = 20%
         window_trades = [
             create_transaction_event(
@@ -781,7 +579,7 @@ class TestValidateWashTradingWindow:
                 event_type="TRADE_EXECUTED",
             ),
         ]  # 1 switch / 5 transitions = 20% alternation (below 60%)
-        config = WashTradingConfig()
+        config = _DEFAULT_CONFIG
 
         # Act
         is_valid, buy_trades, sell_trades = _validate_wash_trading_window(window_trades, config)
@@ -795,7 +593,7 @@ class TestValidateWashTradingWindow:
         """Test that empty window returns False."""
         # Arrange
         window_trades: list[TransactionEvent] = []
-        config = WashTradingConfig()
+        config = _DEFAULT_CONFIG
 
         # Act
         is_valid, buy_trades, sell_trades = _validate_wash_trading_window(window_trades, config)
@@ -808,11 +606,11 @@ class TestValidateWashTradingWindow:
     def test_exactly_minimum_thresholds_passes(self) -> None:
         """Test that window meeting exactly minimum thresholds passes."""
         # Arrange
-        base_time = datetime(2025, 1, 1, 9, 0, 0, tzinfo=timezone.utc)
+        base_time = _BASE_TIME
         # Create pattern with exactly minimum volume: 6 trades * 1667 ≈ 10002 (above 10000)
         # Perfect alternation (100%) is above 60% minimum
         window_trades = create_wash_trading_pattern(base_time=base_time, quantity=1667)
-        config = WashTradingConfig()
+        config = _DEFAULT_CONFIG
 
         # Act
         is_valid, buy_trades, sell_trades = _validate_wash_trading_window(window_trades, config)
@@ -822,6 +620,128 @@ class TestValidateWashTradingWindow:
         assert len(buy_trades) == 3
         assert len(sell_trades) == 3
 
+    def test_alternation_not_computed_when_cheaper_check_fails(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that alternation is only calculated after count and volume checks pass."""
+        # Arrange
+        base_time = _BASE_TIME
+        window_trades = create_wash_trading_pattern(base_time=base_time, quantity=800)  # 4800 volume
+        config = _DEFAULT_CONFIG
+        calls: list[int] = []
+
+        def _tracking_alternation(trades: list[TransactionEvent]) -> float:
+            calls.append(len(trades))
+            return 100.0
+
+        monkeypatch.setattr(
+            wash_trading_detector, "_calculate_alternation_percentage", _tracking_alternation
+        )
+
+        # Act
+        is_valid, _, _ = _validate_wash_trading_window(window_trades, config)
+
+        # Assert: volume check rejects the window before alternation is computed
+        assert is_valid is False
+        assert calls == []
+
+
+class TestScanWindows:
+    """Test suite for the column-based sliding window scanner."""
+
+    def test_returns_match_for_valid_window(self) -> None:
+        """Test that a valid window is reported with its bounds and metrics."""
+        # Arrange: BUY/SELL alternating, 5 minutes apart, 2000 each
+        timestamps = [5 * 60 * 1_000_000 * i for i in range(6)]  # 5 minutes apart
+        is_buy = [True, False, True, False, True, False]
+        quantities = [2000] * 6
+
+        # Act
+        matches = _scan_windows(
+            timestamps, is_buy, quantities, 30 * 60 * 1_000_000, 3, 3, 10000, 60.0
+        )
+
+        # Assert
+        assert matches == [(0, 6, 6000, 6000, 100.0)]
+
+    def test_returns_empty_when_thresholds_not_met(self) -> None:
+        """Test that no matches are returned when volume is below threshold."""
+        # Arrange
+        timestamps = [5 * 60 * 1_000_000 * i for i in range(6)]  # 5 minutes apart
+        is_buy = [True, False, True, False, True, False]
+        quantities = [1000] * 6
+
+        # Act
+        matches = _scan_windows(
+            timestamps, is_buy, quantities, 30 * 60 * 1_000_000, 3, 3, 10000, 60.0
+        )
+
+        # Assert
+        assert matches == []
+
+    def test_group_below_thresholds_skips_window_scan(self) -> None:
+        """Test that a group failing the counts as a whole yields no windows."""
+        # Arrange: enough trades and volume, but only 2 SELLs in the whole group
+        timestamps = [5 * 60 * 1_000_000 * i for i in range(6)]
+        is_buy = [True, False, True, False, True, True]
+        quantities = [5000] * 6
+
+        # Act
+        matches = _scan_windows(
+            timestamps, is_buy, quantities, 30 * 60 * 1_000_000, 3, 3, 10000, 60.0
+        )
+
+        # Assert
+        assert matches == []
+
+    def test_matches_per_window_validation(self) -> None:
+        """Test that prefix-sum metrics agree with validating each window directly."""
+        # Arrange: seeded pseudo-random trades with irregular spacing
+        rng = random.Random(19)
+        base_time = _BASE_TIME
+        timestamp = base_time
+        trades = []
+        for _ in range(200):
+            timestamp += timedelta(seconds=rng.randint(1, 600))
+            trades.append(
+                create_transaction_event(
+                    timestamp=timestamp,
+                    side=rng.choice(["BUY", "SELL"]),
+                    quantity=rng.randint(500, 4000),
+                    event_type="TRADE_EXECUTED",
+                )
+            )
+        config = _DEFAULT_CONFIG
+        window_size = config.window_size
+
+        # Act
+        matches = _scan_windows(
+            [(t.timestamp - base_time) // timedelta(microseconds=1) for t in trades],
+            [t.side == "BUY" for t in trades],
+            [t.quantity for t in trades],
+            window_size // timedelta(microseconds=1),
+            config.min_buy_trades,
+            config.min_sell_trades,
+            config.min_total_volume,
+            config.min_alternation_percentage,
+        )
+
+        # Assert
+        expected = []
+        for start_idx in range(len(trades)):
+            window_trades = _collect_window_trades(trades, start_idx, window_size)
+            is_valid, buy_trades, sell_trades = _validate_wash_trading_window(window_trades, config)
+            if is_valid:
+                expected.append((
+                    start_idx,
+                    start_idx + len(window_trades),
+                    sum(t.quantity for t in buy_trades),
+                    sum(t.quantity for t in sell_trades),
+                    _calculate_alternation_percentage(window_trades),
+                ))
+        assert expected
+        assert matches == expected
+
 
 class TestWashTradingDetectionForGroup:
     """Test suite for wash trading detection within a single group."""
@@ -829,7 +749,7 @@ class TestWashTradingDetectionForGroup:
     def test_detects_valid_wash_trading_pattern(self) -> None:
         """Test that valid wash trading pattern is detected."""
         # Arrange: 3 BUY, 3 SELL, 100% alternation, >10k volume, within 30 minutes
-        base_time = datetime(2025, 1, 1, 9, 0, 0, tzinfo=timezone.utc)
+        base_time = _BASE_TIME
         trades = create_wash_trading_pattern(
             base_time=base_time,
             quantity=2000,
@@ -837,7 +757,7 @@ class TestWashTradingDetectionForGroup:
         )
 
         # Act
-        config = WashTradingConfig()
+        config = _DEFAULT_CONFIG
         sequences = _detect_wash_trading_for_group("ACC001", "IBM", trades, config)
 
         # Assert
@@ -856,7 +776,7 @@ class TestWashTradingDetectionForGroup:
     def test_insufficient_buy_trades_no_detection(self) -> None:
         """Test that insufficient BUY trades (<3) does not trigger detection."""
         # Arrange: Only 2 BUY trades, 3 SELL trades
-        base_time = datetime(2025, 1, 1, 9, 0, 0, tzinfo=timezone.utc)
+        base_time = _BASE_TIME
         trades = [
             create_transaction_event(
                 timestamp=base_time,
@@ -896,7 +816,7 @@ class TestWashTradingDetectionForGroup:
         ]
 
         # Act
-        config = WashTradingConfig()
+        config = _DEFAULT_CONFIG
         sequences = _detect_wash_trading_for_group("ACC001", "IBM", trades, config)
 
         # Assert
@@ -905,7 +825,7 @@ class TestWashTradingDetectionForGroup:
     def test_insufficient_sell_trades_no_detection(self) -> None:
         """Test that insufficient SELL trades (<3) does not trigger detection."""
         # Arrange: 3 BUY trades, only 2 SELL trades
-        base_time = datetime(2025, 1, 1, 9, 0, 0, tzinfo=timezone.utc)
+        base_time = _BASE_TIME
         trades = [
             create_transaction_event(
                 timestamp=base_time,
@@ -945,7 +865,7 @@ class TestWashTradingDetectionForGroup:
         ]
 
         # Act
-        config = WashTradingConfig()
+        config = _DEFAULT_CONFIG
         sequences = _detect_wash_trading_for_group("ACC001", "IBM", trades, config)
 
         # Assert
@@ -954,7 +874,7 @@ class TestWashTradingDetectionForGroup:
     def test_insufficient_alternation_no_detection(self) -> None:
         """Test that insufficient alternation (<60%) does not trigger detection."""
         # Arrange: 3 BUY, 3 SELL, but low alternation (all BUY first, then all SELL)
-        base_time = datetime(2025, 1, 1, 9, 0, 0, tzinfo=timezone.utc)
+        base_time = _BASE_TIME
         trades = [
             create_transaction_event(
                 timestamp=base_time,
@@ -1001,7 +921,7 @@ class TestWashTradingDetectionForGroup:
         ]
 
         # Act
-        config = WashTradingConfig()
+        config = _DEFAULT_CONFIG
         sequences = _detect_wash_trading_for_group("ACC001", "IBM", trades, config)
 
         # Assert: Only 1 switch (BUY->SELL), so alternation = 1/5 = 20% < 60%
@@ -1010,7 +930,7 @@ class TestWashTradingDetectionForGroup:
     def test_insufficient_volume_no_detection(self) -> None:
         """Test that insufficient volume (<10k) does not trigger detection."""
         # Arrange: 3 BUY, 3 SELL, 100% alternation, but only 9k volume
-        base_time = datetime(2025, 1, 1, 9, 0, 0, tzinfo=timezone.utc)
+        base_time = _BASE_TIME
         trades = [
             create_transaction_event(
                 timestamp=base_time,
@@ -1057,7 +977,7 @@ class TestWashTradingDetectionForGroup:
         ]
 
         # Act
-        config = WashTradingConfig()
+        config = _DEFAULT_CONFIG
         sequences = _detect_wash_trading_for_group("ACC001", "IBM", trades, config)
 
         # Assert: Total volume = 9000 < 10000
@@ -1067,7 +987,7 @@ class TestWashTradingDetectionForGroup:
         """Test that exactly 60% alternation triggers detection (edge case)."""
         # Arrange: 6 trades with 3 switches = 3/5 = 60%
         # Pattern: BUY, BUY, SELL, BUY, SELL, SELL = 3 switches / 5 transitions = 60%
-        base_time = datetime(2025, 1, 1, 9, 0, 0, tzinfo=timezone.utc)
+        base_time = _BASE_TIME
         trades = [
             create_transaction_event(
                 timestamp=base_time,
@@ -1114,7 +1034,7 @@ class TestWashTradingDetectionForGroup:
         ]
 
         # Act
-        config = WashTradingConfig()
+        config = _DEFAULT_CONFIG
         sequences = _detect_wash_trading_for_group("ACC001", "IBM", trades, config)
 
         # Assert: 3 switches / 5 transitions = 60% (should trigger)
@@ -1124,7 +1044,7 @@ class TestWashTradingDetectionForGroup:
     def test_exactly_10k_volume_triggers_detection(self) -> None:
         """Test that exactly 10k volume triggers detection (edge case)."""
         # Arrange: 3 BUY, 3 SELL, 100% alternation, exactly 10k volume
-        base_time = datetime(2025, 1, 1, 9, 0, 0, tzinfo=timezone.utc)
+        base_time = _BASE_TIME
         trades = [
             create_transaction_event(
                 timestamp=base_time,
@@ -1171,7 +1091,7 @@ class TestWashTradingDetectionForGroup:
         ]
 
         # Act
-        config = WashTradingConfig()
+        config = _DEFAULT_CONFIG
         sequences = _detect_wash_trading_for_group("ACC001", "IBM", trades, config)
 
         # Assert: Total volume = exactly 10000
@@ -1182,7 +1102,7 @@ class TestWashTradingDetectionForGroup:
         """Test that trades at exactly 30 minutes are included in window."""
         # Arrange: First trade at 0, trades within 30 minutes (including at exactly 30 minutes)
         # Need 3 BUY and 3 SELL within the window starting at base_time
-        base_time = datetime(2025, 1, 1, 9, 0, 0, tzinfo=timezone.utc)
+        base_time = _BASE_TIME
         trades = [
             create_transaction_event(
                 timestamp=base_time,
@@ -1229,7 +1149,7 @@ class TestWashTradingDetectionForGroup:
         ]
 
         # Act
-        config = WashTradingConfig()
+        config = _DEFAULT_CONFIG
         sequences = _detect_wash_trading_for_group("ACC001", "IBM", trades, config)
 
         # Assert: Window starting at base_time should include trade at exactly 30 minutes
@@ -1239,7 +1159,7 @@ class TestWashTradingDetectionForGroup:
     def test_window_boundary_excluded(self) -> None:
         """Test that trades after 30 minutes are excluded from window."""
         # Arrange: First trade at 0, last trade at 31 minutes (outside window)
-        base_time = datetime(2025, 1, 1, 9, 0, 0, tzinfo=timezone.utc)
+        base_time = _BASE_TIME
         trades = [
             create_transaction_event(
                 timestamp=base_time,
@@ -1272,7 +1192,7 @@ class TestWashTradingDetectionForGroup:
         ]
 
         # Act
-        config = WashTradingConfig()
+        config = _DEFAULT_CONFIG
         sequences = _detect_wash_trading_for_group("ACC001", "IBM", trades, config)
 
         # Assert: Window starting at base_time should NOT include trade at 31 minutes
@@ -1282,7 +1202,7 @@ class TestWashTradingDetectionForGroup:
     def test_price_change_percentage_included_when_above_threshold(self) -> None:
         """Test that price_change_percentage is included when ≥1%."""
         # Arrange: Valid pattern with >1% price change
-        base_time = datetime(2025, 1, 1, 9, 0, 0, tzinfo=timezone.utc)
+        base_time = _BASE_TIME
         trades = create_wash_trading_pattern(
             base_time=base_time,
             quantity=2000,
@@ -1290,7 +1210,7 @@ class TestWashTradingDetectionForGroup:
         )
 
         # Act
-        config = WashTradingConfig()
+        config = _DEFAULT_CONFIG
         sequences = _detect_wash_trading_for_group("ACC001", "IBM", trades, config)
 
         # Assert: Price change = (102.5 - 100.0) / 100.0 * 100 = 2.5% > 1%
@@ -1301,7 +1221,7 @@ class TestWashTradingDetectionForGroup:
     def test_price_change_percentage_excluded_when_below_threshold(self) -> None:
         """Test that price_change_percentage is None when <1%."""
         # Arrange: Valid pattern with <1% price change
-        base_time = datetime(2025, 1, 1, 9, 0, 0, tzinfo=timezone.utc)
+        base_time = _BASE_TIME
         trades = [
             create_transaction_event(
                 timestamp=base_time,
@@ -1348,7 +1268,7 @@ class TestWashTradingDetectionForGroup:
         ]
 
         # Act
-        config = WashTradingConfig()
+        config = _DEFAULT_CONFIG
         sequences = _detect_wash_trading_for_group("ACC001", "IBM", trades, config)
 
         # Assert: Price change < 1%, so price_change_percentage should be None
@@ -1356,6 +1276,36 @@ class TestWashTradingDetectionForGroup:
         # Price change = (100.1 - 100.0) / 100.0 * 100 = 0.1% < 1%
         assert sequences[0].price_change_percentage is None
 
+    def test_overlapping_windows_have_independent_totals(self) -> None:
+        """Test that each overlapping window reports only the trades it contains."""
+        # Arrange: 8 alternating trades 5 minutes apart with distinct quantities
+        base_time = _BASE_TIME
+        trades = [
+            create_transaction_event(
+                timestamp=base_time + timedelta(minutes=5 * i),
+                side="BUY" if i % 2 == 0 else "SELL",
+                price="100.0",
+                quantity=1000 * (i + 1),
+                event_type="TRADE_EXECUTED",
+            )
+            for i in range(8)
+        ]
+        config = _DEFAULT_CONFIG
+
+        # Act
+        sequences = _detect_wash_trading_for_group("ACC001", "IBM", trades, config)
+
+        # Assert: windows start at trades 0, 1 and 2 (later windows have < 6 trades)
+        # Window 0: trades 0-6, Window 1: trades 1-7, Window 2: trades 2-7
+        assert len(sequences) == 3
+        for sequence, (start, end) in zip(sequences, [(0, 7), (1, 8), (2, 8)]):
+            window = trades[start:end]
+            assert sequence.start_timestamp == window[0].timestamp
+            assert sequence.end_timestamp == window[-1].timestamp
+            assert sequence.total_buy_qty == sum(t.quantity for t in window if t.side == "BUY")
+            assert sequence.total_sell_qty == sum(t.quantity for t in window if t.side == "SELL")
+            assert sequence.alternation_percentage == 100.0
+
 
 class TestDetectWashTradingTopLevel:
     """Test suite for top-level detect_wash_trading function."""
@@ -1363,7 +1313,7 @@ class TestDetectWashTradingTopLevel:
     def test_requires_pre_filtered_trade_executed_events(self) -> None:
         """Test that detect_wash_trading() expects pre-filtered TRADE_EXECUTED events only."""
         # Arrange: Only TRADE_EXECUTED events (filtering is done by algorithm wrapper)
-        base_time = datetime(2025, 1, 1, 9, 0, 0, tzinfo=timezone.utc)
+        base_time = _BASE_TIME
         events = [
             create_transaction_event(
                 timestamp=base_time,
@@ -1383,7 +1333,7 @@ class TestDetectWashTradingTopLevel:
     def test_groups_by_account_and_product(self) -> None:
         """Test that events are grouped by (account_id, product_id)."""
         # Arrange: Valid pattern for ACC001/IBM, but not enough for ACC002/IBM
-        base_time = datetime(2025, 1, 1, 9, 0, 0, tzinfo=timezone.utc)
+        base_time = _BASE_TIME
         # ACC001/IBM - valid pattern
         events = create_wash_trading_pattern(
             base_time=base_time,
@@ -1432,7 +1382,7 @@ class TestDetectWashTradingTopLevel:
     def test_handles_no_trade_executed_events(self) -> None:
         """Test that events with no TRADE_EXECUTED return empty result."""
         # Arrange
-        base_time = datetime(2025, 1, 1, 9, 0, 0, tzinfo=timezone.utc)
+        base_time = _BASE_TIME
         events = [
             create_transaction_event(
                 timestamp=base_time,
@@ -1459,7 +1409,7 @@ class TestDetectWashTradingTopLevel:
     def test_multiple_windows_for_same_group(self) -> None:
         """Test that multiple overlapping windows can produce multiple sequences."""
         # Arrange: Two distinct 30-minute windows with valid patterns
-        base_time = datetime(2025, 1, 1, 9, 0, 0, tzinfo=timezone.utc)
+        base_time = _BASE_TIME
         # First window (0-30 minutes)
         events = create_wash_trading_pattern(
             base_time=base_time,
@@ -1481,3 +1431,192 @@ class TestDetectWashTradingTopLevel:
         # Assert: Should detect multiple sequences (sliding windows)
         assert len(sequences) >= 2
 
+    def test_dedupe_collapses_overlapping_windows(self) -> None:
+        """Test that the "dedupe" overlap policy reports each overlapping run once."""
+        # Arrange: 12 alternating trades 1 minute apart (many overlapping windows),
+        # then a distinct pattern well after them
+        base_time = _BASE_TIME
+        events = create_wash_trading_pattern(
+            base_time=base_time, quantity=2000, time_interval_minutes=1
+        )
+        events.extend(
+            create_wash_trading_pattern(
+                base_time=base_time + timedelta(minutes=6), quantity=2000, time_interval_minutes=1
+            )
+        )
+        events.extend(
+            create_wash_trading_pattern(
+                base_time=base_time + timedelta(minutes=60), quantity=2000, price_start="103.0"
+            )
+        )
+        config = WashTradingConfig(overlap_policy="dedupe")
+
+        # Act
+        all_windows = detect_wash_trading(events)
+        deduped = detect_wash_trading(events, config)
+
+        # Assert: earliest window of each run is kept
+        assert len(all_windows) > 2
+        assert [seq.start_timestamp for seq in deduped] == [
+            base_time,
+            base_time + timedelta(minutes=60),
+        ]
+        assert deduped[0] == all_windows[0]
+
+    def test_skip_overlapping_reports_non_overlapping_windows(self) -> None:
+        """Test that the "skip" overlap policy resumes the scan after each reported window."""
+        # Arrange: 18 alternating trades 1 minute apart, so many windows overlap
+        base_time = _BASE_TIME
+        events = create_trade_sequence("BS" * 9, quantities=2000, time_interval_minutes=1)
+        config = WashTradingConfig(overlap_policy="skip")
+
+        # Act
+        all_windows = detect_wash_trading(events)
+        skipped = detect_wash_trading(events, config)
+        with_state = detect_wash_trading(events, config, state=WashTradingScanState())
+
+        # Assert: windows are disjoint and the first one is unchanged
+        assert len(all_windows) > len(skipped) >= 1
+        assert skipped[0] == all_windows[0]
+        for previous, current in zip(skipped, skipped[1:]):
+            assert current.start_timestamp > previous.end_timestamp
+        assert skipped[0].start_timestamp == base_time
+        assert with_state == skipped
+
+    def test_rejects_unknown_overlap_policy(self) -> None:
+        """Test that overlap_policy must be one of the supported policies."""
+        with pytest.raises(ValueError, match="overlap_policy"):
+            WashTradingConfig(overlap_policy="merge")
+
+    def test_parallel_detection_matches_serial(self) -> None:
+        """Test that max_workers > 1 returns the same sequences in the same order."""
+        # Arrange: Valid patterns for three accounts
+        base_time = _BASE_TIME
+        events: list[TransactionEvent] = []
+        for account_id in ("ACC001", "ACC002", "ACC003"):
+            events.extend(
+                create_wash_trading_pattern(
+                    base_time=base_time,
+                    account_id=account_id,
+                    quantity=2000,
+                    price_start="100.0",
+                )
+            )
+
+        # Act
+        serial = detect_wash_trading(events)
+        parallel = detect_wash_trading(events, max_workers=2)
+
+        # Assert
+        assert len(serial) == 3
+        assert parallel == serial
+
+    def test_rejects_non_positive_max_workers(self) -> None:
+        """Test that max_workers must be positive."""
+        with pytest.raises(ValueError, match="max_workers"):
+            detect_wash_trading([], max_workers=0)
+
+
+class TestWashTradingScanState:
+    """Test suite for incremental detection with WashTradingScanState."""
+
+    def test_appended_events_match_full_rescan(
+        self, valid_pattern: tuple[TransactionEvent, ...]
+    ) -> None:
+        """Test that resuming from state gives the same result as a full scan."""
+        # Arrange
+        base_time = _BASE_TIME
+        first_batch = list(valid_pattern)
+        second_batch = create_wash_trading_pattern(
+            base_time=base_time + timedelta(minutes=35), quantity=2000, price_start="103.0"
+        )
+        state = WashTradingScanState()
+
+        # Act
+        first_sequences = detect_wash_trading(first_batch, state=state)
+        resumed_sequences = detect_wash_trading(first_batch + second_batch, state=state)
+
+        # Assert
+        assert first_sequences == detect_wash_trading(first_batch)
+        assert resumed_sequences == detect_wash_trading(first_batch + second_batch)
+        assert len(resumed_sequences) >= 2
+
+    def test_closed_windows_are_not_rescanned(
+        self, valid_pattern: tuple[TransactionEvent, ...]
+    ) -> None:
+        """Test that windows ending before the last trade are reused from state."""
+        # Arrange
+        base_time = _BASE_TIME
+        first_batch = list(valid_pattern)
+        # A trade at 60 minutes falls outside every window of the first pattern
+        closing_trade = create_transaction_event(
+            timestamp=base_time + timedelta(minutes=60),
+            side="BUY",
+            price="100.0",
+            quantity=2000,
+            event_type="TRADE_EXECUTED",
+        )
+        state = WashTradingScanState()
+        detect_wash_trading(first_batch + [closing_trade], state=state)
+
+        # Act
+        group_state = state.groups[("ACC001", "IBM")]
+
+        # Assert: only the closing trade's window is still open
+        assert group_state.open_start_idx == 6
+        assert len(group_state.closed_sequences) == 1
+
+    def test_unchanged_group_is_not_rescanned(
+        self,
+        valid_pattern: tuple[TransactionEvent, ...],
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that re-running identical input returns the memoized result."""
+        # Arrange
+        events = list(valid_pattern)
+        state = WashTradingScanState()
+        first_sequences = detect_wash_trading(events, state=state)
+
+        def fail_scan(*args: object, **kwargs: object) -> None:
+            raise AssertionError("unchanged group was rescanned")
+
+        monkeypatch.setattr(wash_trading_detector, "_detect_wash_trading_for_group", fail_scan)
+
+        # Act
+        sequences = detect_wash_trading(list(events), state=state)
+
+        # Assert
+        assert sequences == first_sequences
+        assert len(sequences) > 0
+
+    def test_non_append_input_is_rescanned(
+        self, valid_pattern: tuple[TransactionEvent, ...]
+    ) -> None:
+        """Test that a group whose earlier trades changed is scanned from scratch."""
+        # Arrange
+        low_volume_pattern = create_wash_trading_pattern(base_time=_BASE_TIME, quantity=100)
+        state = WashTradingScanState()
+        detect_wash_trading(list(valid_pattern), state=state)
+
+        # Act
+        sequences = detect_wash_trading(low_volume_pattern, state=state)
+
+        # Assert
+        assert sequences == []
+
+    def test_config_change_resets_state(
+        self, valid_pattern: tuple[TransactionEvent, ...]
+    ) -> None:
+        """Test that results cached for one config are not reused for another."""
+        # Arrange
+        events = list(valid_pattern)
+        state = WashTradingScanState()
+        detect_wash_trading(events, state=state)
+        strict_config = WashTradingConfig(min_total_volume=50000)
+
+        # Act
+        sequences = detect_wash_trading(events, config=strict_config, state=state)
+
+        # Assert
+        assert sequences == []
+        assert state.config == strict_config
@@ -17,6 +17,7 @@ from .test_data_factories import (
     create_suspicious_sequence,
     create_suspicious_sequence_layering,
     create_suspicious_sequence_wash_trading,
+    create_trade_sequence,
     create_transaction_event,
     create_transaction_event_dto,
     create_wash_trading_pattern,
@@ -31,6 +32,7 @@ __all__ = [
     "create_suspicious_sequence_layering",
     "create_suspicious_sequence_wash_trading",
     "create_wash_trading_pattern",
+    "create_trade_sequence",
     "create_layering_pattern",
     "create_mock_algorithm",
     "create_mock_async_function",
@@ -54,7 +54,7 @@ from __future__ import annotations
 from collections.abc import Callable
 from contextlib import contextmanager
 from typing import Any
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, Mock, patch
 
 from layering_detection.models import SuspiciousSequence
 
@@ -62,13 +62,18 @@ from layering_detection.models import SuspiciousSequence
 def create_mock_algorithm(
     detect_return_value: list[SuspiciousSequence] | None = None,
     detect_side_effect: Exception | Callable[[], Any] | None = None,
-) -> MagicMock:
+) -> Mock:
     """
-    Create a configured MagicMock instance for an algorithm.
+    Create a configured mock instance for an algorithm.
 
     This factory function creates a mock algorithm instance with the `detect` method
     configured to return a specific value or raise an exception.
 
+    The mock is a plain `Mock` specced to `detect` only: services call nothing
+    else on an algorithm, and it is about twice as cheap to create as a
+    `MagicMock`, which sets up every magic method. `detect` still records
+    calls (`call_count`, `assert_called_once()`, ...).
+
     Args:
         detect_return_value: List of SuspiciousSequence objects to return from detect().
             If None, returns empty list by default.
@@ -76,7 +81,7 @@ def create_mock_algorithm(
             If provided, takes precedence over detect_return_value.
 
     Returns:
-        MagicMock instance configured as an algorithm with detect() method.
+        Mock instance configured as an algorithm with detect() method.
 
     Examples:
         >>> # Return empty list (default)
@@ -92,7 +97,7 @@ def create_mock_algorithm(
         >>> mock = create_mock_algorithm(detect_side_effect=ValueError("Invalid"))
         >>> mock.detect([])  # Raises ValueError
     """
-    mock_algorithm = MagicMock()
+    mock_algorithm = Mock(spec=["detect"])
     if detect_side_effect is not None:
         mock_algorithm.detect.side_effect = detect_side_effect
     else:
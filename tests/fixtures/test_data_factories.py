@@ -58,18 +58,19 @@ Example:
 
 from __future__ import annotations
 
+import sys
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
-from typing import TYPE_CHECKING
+from functools import lru_cache
+from typing import Sequence
 from uuid import UUID, uuid4
 
-if TYPE_CHECKING:
-    from layering_detection.models import SuspiciousSequence, TransactionEvent
-    from services.shared.api_models import (
-        AlgorithmRequest,
-        AlgorithmResponse,
-        TransactionEventDTO,
-    )
+from layering_detection.models import SuspiciousSequence, TransactionEvent
+from services.shared.api_models import (
+    AlgorithmRequest,
+    AlgorithmResponse,
+    TransactionEventDTO,
+)
 
 
 # Default values matching common test patterns
@@ -83,6 +84,29 @@ _DEFAULT_PRICE_STR = "100.50"
 _DEFAULT_QUANTITY = 1000
 _DEFAULT_EVENT_TYPE = "ORDER_PLACED"
 
+# Price increment between consecutive events in pattern factories
+_PRICE_STEP = Decimal("0.5")
+
+# Pattern factory tables, built once at import
+_WASH_TRADING_SIDES = ("BUY", "SELL", "BUY", "SELL", "BUY", "SELL")  # Perfect alternation
+_WASH_TRADING_PRICE_OFFSETS = tuple(_PRICE_STEP * i for i in range(len(_WASH_TRADING_SIDES)))
+_LAYERING_PRICE_OFFSETS = _WASH_TRADING_PRICE_OFFSETS[:3]
+_LAYERING_ORDER_OFFSETS = tuple(timedelta(seconds=i) for i in range(3))
+_LAYERING_CANCEL_OFFSETS = tuple(timedelta(seconds=3 + i) for i in range(3))
+_LAYERING_TRADE_OFFSET = timedelta(seconds=6)
+
+
+@lru_cache(maxsize=64)
+def _minute_offsets(interval_minutes: int, count: int) -> tuple[timedelta, ...]:
+    """Offsets of `count` events spaced `interval_minutes` apart, starting at zero."""
+    return tuple(timedelta(minutes=i * interval_minutes) for i in range(count))
+
+
+@lru_cache(maxsize=256)
+def _to_decimal(value: str) -> Decimal:
+    """Parse a price literal; tests reuse a handful of literals, and Decimal is immutable."""
+    return Decimal(value)
+
 
 def create_transaction_event(
     timestamp: datetime | None = None,
@@ -122,8 +146,6 @@ def create_transaction_event(
         >>> assert event.side == "SELL"
         >>> assert event.event_type == "TRADE_EXECUTED"
     """
-    from layering_detection.models import TransactionEvent
-
     if timestamp is None:
         timestamp = _DEFAULT_TIMESTAMP
     if account_id is None:
@@ -135,20 +157,21 @@ def create_transaction_event(
     if price is None:
         price = _DEFAULT_PRICE
     elif isinstance(price, str):
-        price = Decimal(price)
+        price = _to_decimal(price)
     if quantity is None:
         quantity = _DEFAULT_QUANTITY
     if event_type is None:
         event_type = _DEFAULT_EVENT_TYPE
 
+    # Interned like the production ingress paths (CSV parser, DTO converter)
     return TransactionEvent(
         timestamp=timestamp,
         account_id=account_id,
         product_id=product_id,
-        side=side,  # type: ignore[arg-type]
+        side=sys.intern(side),  # type: ignore[arg-type]
         price=price,
         quantity=quantity,
-        event_type=event_type,  # type: ignore[arg-type]
+        event_type=sys.intern(event_type),  # type: ignore[arg-type]
     )
 
 
@@ -160,6 +183,8 @@ def create_transaction_event_dto(
     price: str | None = None,
     quantity: int | None = None,
     event_type: str | None = None,
+    *,
+    validate: bool = True,
 ) -> TransactionEventDTO:
     """
     Factory function for creating TransactionEventDTO test data.
@@ -176,6 +201,8 @@ def create_transaction_event_dto(
         quantity: Trade quantity. Defaults to 1000.
         event_type: Event type ("ORDER_PLACED", "ORDER_CANCELLED", "TRADE_EXECUTED").
             Defaults to "ORDER_PLACED".
+        validate: Run Pydantic validation. Pass False to build known-good DTOs in
+            bulk with `model_construct()`, which skips validation entirely.
 
     Returns:
         TransactionEventDTO instance with specified or default values.
@@ -189,8 +216,6 @@ def create_transaction_event_dto(
         >>> assert dto.account_id == "ACC002"
         >>> assert dto.side == "SELL"
     """
-    from services.shared.api_models import TransactionEventDTO
-
     if timestamp is None:
         timestamp = _DEFAULT_TIMESTAMP_STR
     if account_id is None:
@@ -206,7 +231,8 @@ def create_transaction_event_dto(
     if event_type is None:
         event_type = _DEFAULT_EVENT_TYPE
 
-    return TransactionEventDTO(
+    factory = TransactionEventDTO if validate else TransactionEventDTO.model_construct
+    return factory(
         timestamp=timestamp,
         account_id=account_id,
         product_id=product_id,
@@ -221,6 +247,8 @@ def create_algorithm_request(
     request_id: str | None = None,
     event_fingerprint: str | None = None,
     events: list[TransactionEventDTO] | None = None,
+    *,
+    validate: bool = True,
 ) -> AlgorithmRequest:
     """
     Factory function for creating AlgorithmRequest test data.
@@ -231,6 +259,8 @@ def create_algorithm_request(
         request_id: UUID string. Defaults to a new UUID4.
         event_fingerprint: SHA256 hexdigest (64 hex characters). Defaults to "a" * 64.
         events: List of TransactionEventDTO. Defaults to a single default event.
+        validate: Run Pydantic validation. Pass False to skip it with
+            `model_construct()` (the events list length is not checked either).
 
     Returns:
         AlgorithmRequest instance with specified or default values.
@@ -242,16 +272,15 @@ def create_algorithm_request(
         ... )
         >>> assert len(request.events) == 1
     """
-    from services.shared.api_models import AlgorithmRequest
-
     if request_id is None:
         request_id = str(uuid4())
     if event_fingerprint is None:
         event_fingerprint = "a" * 64  # Valid SHA256 hexdigest
     if events is None:
-        events = [create_transaction_event_dto()]
+        events = [create_transaction_event_dto(validate=validate)]
 
-    return AlgorithmRequest(
+    factory = AlgorithmRequest if validate else AlgorithmRequest.model_construct
+    return factory(
         request_id=request_id,
         event_fingerprint=event_fingerprint,
         events=events,
@@ -265,6 +294,8 @@ def create_algorithm_response(
     results: list | None = None,
     error: str | None = None,
     final_status: bool = True,
+    *,
+    validate: bool = True,
 ) -> AlgorithmResponse:
     """
     Factory function for creating AlgorithmResponse test data.
@@ -279,6 +310,8 @@ def create_algorithm_response(
         results: List of SuspiciousSequenceDTO. Defaults to empty list for success, None for failure.
         error: Error message. Defaults to None for success, required for failure.
         final_status: Whether service completed (no more retries). Defaults to True.
+        validate: Run Pydantic validation. Pass False to skip it with
+            `model_construct()`; status/error/results are still made consistent.
 
     Returns:
         AlgorithmResponse instance with specified or default values.
@@ -292,8 +325,6 @@ def create_algorithm_response(
         >>> assert response.service_name == "wash_trading"
         >>> assert response.status == "success"
     """
-    from services.shared.api_models import AlgorithmResponse
-
     if request_id is None:
         request_id = str(uuid4())
 
@@ -309,7 +340,8 @@ def create_algorithm_response(
         if error is None:
             error = "Test error"  # Provide default error if not specified
 
-    return AlgorithmResponse(
+    factory = AlgorithmResponse if validate else AlgorithmResponse.model_construct
+    return factory(
         request_id=request_id,
         service_name=service_name,  # type: ignore[arg-type]
         status=status,  # type: ignore[arg-type]
@@ -360,8 +392,6 @@ def create_suspicious_sequence_layering(
         >>> assert sequence.side == "SELL"
         >>> assert sequence.num_cancelled_orders == 5
     """
-    from layering_detection.models import SuspiciousSequence
-
     if account_id is None:
         account_id = _DEFAULT_ACCOUNT_ID
     if product_id is None:
@@ -438,8 +468,6 @@ def create_suspicious_sequence_wash_trading(
         >>> assert sequence.alternation_percentage == 80.0
         >>> assert sequence.side is None
     """
-    from layering_detection.models import SuspiciousSequence
-
     if account_id is None:
         account_id = _DEFAULT_ACCOUNT_ID
     if product_id is None:
@@ -542,8 +570,6 @@ def create_wash_trading_pattern(
         >>> assert events[1].side == "SELL"
         >>> assert all(e.event_type == "TRADE_EXECUTED" for e in events)
     """
-    from decimal import Decimal
-
     if base_time is None:
         base_time = _DEFAULT_TIMESTAMP
     if account_id is None:
@@ -551,15 +577,17 @@ def create_wash_trading_pattern(
     if product_id is None:
         product_id = _DEFAULT_PRODUCT_ID
     if isinstance(price_start, str):
-        price_start = Decimal(price_start)
+        price_start = _to_decimal(price_start)
 
     events: list[TransactionEvent] = []
-    sides = ["BUY", "SELL", "BUY", "SELL", "BUY", "SELL"]  # Perfect alternation
+    time_offsets = _minute_offsets(time_interval_minutes, len(_WASH_TRADING_SIDES))
 
-    for i, side in enumerate(sides):
+    for side, price_offset, time_offset in zip(
+        _WASH_TRADING_SIDES, _WASH_TRADING_PRICE_OFFSETS, time_offsets
+    ):
         # Price increments by 0.5 for each trade
-        price = price_start + Decimal(str(i * 0.5))
-        timestamp = base_time + timedelta(minutes=i * time_interval_minutes)
+        price = price_start + price_offset
+        timestamp = base_time + time_offset
 
         event = create_transaction_event(
             timestamp=timestamp,
@@ -575,6 +603,62 @@ def create_wash_trading_pattern(
     return events
 
 
+def create_trade_sequence(
+    sides: str,
+    quantities: int | Sequence[int] = 1000,
+    prices: Sequence[Decimal | str] | None = None,
+    base_time: datetime | None = None,
+    time_interval_minutes: int = 5,
+    account_id: str | None = None,
+    product_id: str | None = None,
+) -> list[TransactionEvent]:
+    """
+    Factory function for creating a sequence of TRADE_EXECUTED events from a side pattern.
+
+    Compact alternative to listing trades one by one for table-driven tests:
+    one trade per character of `sides`, evenly spaced in time.
+
+    Args:
+        sides: Side pattern, one character per trade: "B" for BUY, "S" for SELL.
+        quantities: Quantity for every trade, or one quantity per trade.
+            Defaults to 1000.
+        prices: One price per trade. Defaults to 100.0 increasing by 0.5 per trade.
+        base_time: Timestamp of the first trade. Defaults to 2025-01-01 09:00:00 UTC.
+        time_interval_minutes: Minutes between trades. Defaults to 5.
+        account_id: Account identifier. Defaults to "ACC001".
+        product_id: Product identifier. Defaults to "IBM".
+
+    Returns:
+        List of TransactionEvent instances sorted by timestamp.
+
+    Example:
+        >>> trades = create_trade_sequence("BSBS", quantities=[1000, 2000, 1000, 2000])
+        >>> [t.side for t in trades]
+        ['BUY', 'SELL', 'BUY', 'SELL']
+    """
+    if base_time is None:
+        base_time = _DEFAULT_TIMESTAMP
+    if isinstance(quantities, int):
+        quantities = [quantities] * len(sides)
+    if prices is None:
+        prices = [_DEFAULT_PRICE + _PRICE_STEP * i for i in range(len(sides))]
+
+    side_names = {"B": "BUY", "S": "SELL"}
+    time_offsets = _minute_offsets(time_interval_minutes, len(sides))
+    return [
+        create_transaction_event(
+            timestamp=base_time + time_offsets[i],
+            account_id=account_id,
+            product_id=product_id,
+            side=side_names[side],
+            price=price,
+            quantity=quantity,
+            event_type="TRADE_EXECUTED",
+        )
+        for i, (side, quantity, price) in enumerate(zip(sides, quantities, prices, strict=True))
+    ]
+
+
 def create_layering_pattern(
     base_time: datetime | None = None,
     account_id: str | None = None,
@@ -626,8 +710,6 @@ def create_layering_pattern(
         >>> assert events[6].event_type == "TRADE_EXECUTED"
         >>> assert events[6].side == "BUY"  # Opposite of SELL
     """
-    from decimal import Decimal
-
     if base_time is None:
         base_time = _DEFAULT_TIMESTAMP
     if account_id is None:
@@ -635,26 +717,26 @@ def create_layering_pattern(
     if product_id is None:
         product_id = _DEFAULT_PRODUCT_ID
     if isinstance(order_price_start, str):
-        order_price_start = Decimal(order_price_start)
+        order_price_start = _to_decimal(order_price_start)
     if isinstance(cancel_price_start, str):
-        cancel_price_start = Decimal(cancel_price_start)
+        cancel_price_start = _to_decimal(cancel_price_start)
     if opposite_side is None:
         opposite_side = "SELL" if side == "BUY" else "BUY"
     if trade_price is None:
         # Default trade price: slightly lower for BUY orders, slightly higher for SELL orders
         if side == "BUY":
-            trade_price = order_price_start - Decimal("0.5")
+            trade_price = order_price_start - _PRICE_STEP
         else:
-            trade_price = order_price_start + Decimal("0.5")
+            trade_price = order_price_start + _PRICE_STEP
     elif isinstance(trade_price, str):
-        trade_price = Decimal(trade_price)
+        trade_price = _to_decimal(trade_price)
 
     events: list[TransactionEvent] = []
 
     # 3 ORDER_PLACED events within 10 seconds (at 0s, 1s, 2s)
-    for i in range(3):
-        price = order_price_start + Decimal(str(i * 0.5))
-        timestamp = base_time + timedelta(seconds=i)
+    for price_offset, time_offset in zip(_LAYERING_PRICE_OFFSETS, _LAYERING_ORDER_OFFSETS):
+        price = order_price_start + price_offset
+        timestamp = base_time + time_offset
         event = create_transaction_event(
             timestamp=timestamp,
             account_id=account_id,
@@ -668,9 +750,9 @@ def create_layering_pattern(
 
     # 3 ORDER_CANCELLED events within 5 seconds of last order (at 3s, 4s, 5s)
     # Last order is at base_time + 2s, so cancellations must be <= base_time + 7s
-    for i in range(3):
-        price = cancel_price_start + Decimal(str(i * 0.5))
-        timestamp = base_time + timedelta(seconds=3 + i)
+    for price_offset, time_offset in zip(_LAYERING_PRICE_OFFSETS, _LAYERING_CANCEL_OFFSETS):
+        price = cancel_price_start + price_offset
+        timestamp = base_time + time_offset
         event = create_transaction_event(
             timestamp=timestamp,
             account_id=account_id,
@@ -685,7 +767,7 @@ def create_layering_pattern(
     # 1 TRADE_EXECUTED event on opposite side within 2 seconds of last cancellation
     # Last cancellation is at base_time + 5s, so trade must be <= base_time + 7s
     # We'll place it at base_time + 6s to be safe
-    trade_timestamp = base_time + timedelta(seconds=6)
+    trade_timestamp = base_time + _LAYERING_TRADE_OFFSET
     trade_event = create_transaction_event(
         timestamp=trade_timestamp,
         account_id=account_id,
@@ -195,6 +195,16 @@ class TestTransactionEventDTO:
         assert data["timestamp"] == "2025-01-15T10:30:00"
         assert data["price"] == "100.50"  # Decimal preserved as string
 
+    def test_factory_without_validation_matches_validated(self) -> None:
+        """Test that validate=False builds the same DTO, skipping validators."""
+        validated = create_transaction_event_dto()
+        constructed = create_transaction_event_dto(validate=False)
+        assert constructed == validated
+
+        # Invalid input is not rejected when validation is skipped
+        unchecked = create_transaction_event_dto(quantity=-1, validate=False)
+        assert unchecked.quantity == -1
+
 
 class TestSuspiciousSequenceDTO:
     """Tests for SuspiciousSequenceDTO model."""
@@ -6,6 +6,7 @@ Tests bidirectional conversion, precision preservation, and round-trip integrity
 
 from __future__ import annotations
 
+import sys
 from datetime import datetime, timezone
 from decimal import Decimal
 
@@ -161,6 +162,13 @@ class TestTransactionEventConversions:
             restored = dto_to_transaction_event(dto)
             assert restored == event
 
+    def test_dto_to_transaction_event_interns_enums(self) -> None:
+        """Test that the converted side and event type are interned strings."""
+        dto = create_transaction_event_dto(side="SELL", event_type="TRADE_EXECUTED")
+        event = dto_to_transaction_event(dto)
+        assert event.side is sys.intern("SELL")
+        assert event.event_type is sys.intern("TRADE_EXECUTED")
+
 
 class TestSuspiciousSequenceConversions:
     """Tests for SuspiciousSequence ↔ SuspiciousSequenceDTO conversions."""
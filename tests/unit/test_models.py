@@ -316,3 +316,68 @@ class TestSuspiciousSequenceExtensions:
         with pytest.raises(Exception):  # FrozenInstanceError or AttributeError
             sequence.detection_type = "WASH_TRADING"  # type: ignore[misc]
 
+    def test_uses_slots(self) -> None:
+        """Test that sequences carry no per-instance __dict__."""
+        # Arrange
+        base_time = datetime(2025, 1, 1, 9, 0, 0, tzinfo=timezone.utc)
+
+        # Act
+        sequence = SuspiciousSequence(
+            account_id="ACC001",
+            product_id="IBM",
+            start_timestamp=base_time,
+            end_timestamp=base_time,
+            total_buy_qty=6000,
+            total_sell_qty=6000,
+            detection_type="WASH_TRADING",
+            alternation_percentage=100.0,
+        )
+
+        # Assert
+        assert not hasattr(sequence, "__dict__")
+
+
+class TestTransactionEvent:
+    """Test suite for TransactionEvent layout."""
+
+    def test_uses_slots(self) -> None:
+        """Test that events carry no per-instance __dict__."""
+        # Arrange
+        event = TransactionEvent(
+            timestamp=datetime(2025, 1, 1, 9, 0, 0, tzinfo=timezone.utc),
+            account_id="ACC001",
+            product_id="IBM",
+            side="BUY",
+            price=Decimal("100.0"),
+            quantity=1000,
+            event_type="TRADE_EXECUTED",
+        )
+
+        # Act / Assert
+        assert not hasattr(event, "__dict__")
+        with pytest.raises(AttributeError):
+            event.quantity = 2000  # type: ignore[misc]
+
+    def test_timestamp_us_is_cached_and_excluded_from_equality(self) -> None:
+        """Test that the derived epoch microseconds are cached and not compared."""
+        # Arrange
+        fields = dict(
+            timestamp=datetime(2025, 1, 1, 9, 0, 0, 123456, tzinfo=timezone.utc),
+            account_id="ACC001",
+            product_id="IBM",
+            side="BUY",
+            price=Decimal("100.0"),
+            quantity=1000,
+            event_type="TRADE_EXECUTED",
+        )
+        event = TransactionEvent(**fields)
+        untouched = TransactionEvent(**fields)
+
+        # Act
+        timestamp_us = event.timestamp_us
+
+        # Assert
+        assert timestamp_us == 1735722000_123456
+        assert event.timestamp_us is timestamp_us
+        assert event == untouched
+        assert hash(event) == hash(untouched)
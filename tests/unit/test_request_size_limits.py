@@ -44,6 +44,7 @@ class TestPydanticMaxLengthValidation:
                 price="100.50",
                 quantity=1000,
                 event_type="ORDER_PLACED",
+                validate=False,  # only the list length is under test
             )
             for _ in range(100000)
         ]
@@ -70,6 +71,7 @@ class TestPydanticMaxLengthValidation:
                 price="100.50",
                 quantity=1000,
                 event_type="ORDER_PLACED",
+                validate=False,  # only the list length is under test
             )
             for _ in range(100001)  # Exceeds max_length
         ]
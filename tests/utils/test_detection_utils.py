@@ -11,6 +11,7 @@ import pytest
 from layering_detection.utils.detection_utils import (
     get_opposite_side,
     group_events_by_account_product,
+    to_epoch_microseconds,
     validate_positive,
 )
 from layering_detection.models import TransactionEvent
@@ -422,3 +423,48 @@ class TestGetOppositeSide:
         assert result == expected
         # Round trip: opposite of opposite should be original
         assert get_opposite_side(result) == side
+
+
+class TestToEpochMicroseconds:
+    """Test suite for to_epoch_microseconds() function."""
+
+    def test_converts_utc_datetime(self) -> None:
+        """Test that a UTC datetime is converted to epoch microseconds."""
+        # Arrange
+        timestamp = datetime(2025, 1, 1, 9, 0, 0, 123456, tzinfo=timezone.utc)
+
+        # Act
+        result = to_epoch_microseconds(timestamp)
+
+        # Assert
+        assert result == 1735722000_123456
+
+    def test_non_utc_offset_is_normalized(self) -> None:
+        """Test that the same instant in different timezones gives the same value."""
+        # Arrange
+        utc_time = datetime(2025, 1, 1, 9, 0, 0, tzinfo=timezone.utc)
+        offset_time = utc_time.astimezone(timezone(timedelta(hours=2)))
+
+        # Act & Assert
+        assert to_epoch_microseconds(offset_time) == to_epoch_microseconds(utc_time)
+
+    def test_naive_datetime_treated_as_utc(self) -> None:
+        """Test that naive datetimes are interpreted as UTC, not local time."""
+        # Arrange
+        naive_time = datetime(2025, 1, 1, 9, 0, 0)
+        aware_time = naive_time.replace(tzinfo=timezone.utc)
+
+        # Act & Assert
+        assert to_epoch_microseconds(naive_time) == to_epoch_microseconds(aware_time)
+
+    def test_differences_match_timedelta(self) -> None:
+        """Test that differences are exact, including window boundaries."""
+        # Arrange
+        start = datetime(2025, 1, 1, 9, 0, 0, tzinfo=timezone.utc)
+        end = start + timedelta(minutes=30)
+
+        # Act
+        difference = to_epoch_microseconds(end) - to_epoch_microseconds(start)
+
+        # Assert
+        assert difference == 30 * 60 * 1_000_000
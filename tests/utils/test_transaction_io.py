@@ -1,9 +1,15 @@
 import csv
 import datetime as dt
+import sys
 from pathlib import Path
 
 from layering_detection.models import SuspiciousSequence
-from layering_detection.utils.transaction_io import read_transactions, write_suspicious_accounts
+from layering_detection.utils.transaction_io import (
+    _parse_event_type,
+    _parse_side,
+    read_transactions,
+    write_suspicious_accounts,
+)
 from layering_detection.detectors.layering_detector import detect_suspicious_sequences
 
 
@@ -159,3 +165,12 @@ class TestWriteSuspiciousAccountsSynthetic:
         assert row2["detected_timestamp"].startswith(
             (base + dt.timedelta(minutes=1, seconds=10)).isoformat()
         )
+
+
+class TestParseInterning:
+    def test_returns_interned_side(self) -> None:
+        assert _parse_side(" buy ") is sys.intern("BUY")
+        assert _parse_side("Sell") is sys.intern("SELL")
+
+    def test_returns_interned_event_type(self) -> None:
+        assert _parse_event_type(" trade_executed ") is sys.intern("TRADE_EXECUTED")